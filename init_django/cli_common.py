@@ -6,17 +6,26 @@ remain compatible with the same API and semantics.
 
 import json
 import os
+import shlex
+import shutil
 import subprocess
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from shutil import copyfile
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import click
 
+from init_django.command_backend import get_backend
+
 
 def run(cmd: str, check: bool = True) -> None:
-    """Run a shell command and echo its output.
+    """Run a shell command through the active backend and echo its output.
+
+    See :mod:`init_django.command_backend` for recording and replaying
+    commands instead of executing them.
 
     Parameters
     ----------
@@ -29,9 +38,7 @@ def run(cmd: str, check: bool = True) -> None:
 
     click.echo(f"→ {cmd}")
     try:
-        completed = subprocess.run(
-            cmd, shell=True, check=check, capture_output=True, text=True
-        )
+        completed = get_backend().run(cmd, check=check)
         if completed.stdout:
             click.echo(completed.stdout)
         if completed.stderr:
@@ -93,28 +100,340 @@ def create_virtualenv(venv_path: Path) -> None:
     run(f"{venv_path}/bin/pip install --upgrade pip wheel")
 
 
-def install_dependencies(venv_path: Path, django_version: str) -> None:
-    """Install Django and common packages into ``venv_path``."""
+DEFAULT_DJANGO_VERSION = "5.2.3"
+
+WHEELHOUSE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "tribeca-django-init"
+    / "wheels"
+)
+
+
+# Requirement files (under templates/requirements) making up each dependency set
+DEPENDENCY_SETS = {"runtime": ("base.txt", "prod.txt"), "dev": ("dev.txt",)}
+
+
+def read_requirements(name: str) -> List[str]:
+    """Return the specifiers in ``templates/requirements/<name>``.
+
+    Comments and ``-r`` includes are skipped; :data:`DEPENDENCY_SETS` lists
+    the included files explicitly.
+    """
+
+    specs = []
+    for line in (TEMPLATES_DIR / "requirements" / name).read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line and not line.startswith("-"):
+            specs.append(line)
+    return specs
+
+
+def dependency_sets(django_version: str) -> Dict[str, List[str]]:
+    """Return the pip specifiers of each dependency set for ``django_version``."""
 
     if "." in django_version and django_version.count(".") == 2:
         django_spec = f"django=={django_version}"
     else:
         django_spec = f"django~={django_version}"
-    run(
-        f"{venv_path}/bin/pip install '{django_spec}' "
-        "djangorestframework django-environ psycopg[binary] "
-        "gunicorn whitenoise pytest-django black isort pre-commit"
-    )
+    sets = {}
+    for set_name, files in DEPENDENCY_SETS.items():
+        specs = [spec for name in files for spec in read_requirements(name)]
+        sets[set_name] = [
+            django_spec if spec.lower().startswith("django==") else spec
+            for spec in specs
+        ]
+    return sets
+
+
+def dependency_specs(django_version: str, dev: bool = True) -> List[str]:
+    """Return the pip requirement specifiers installed for ``django_version``.
+
+    With ``dev=False`` only the runtime set (``requirements/prod.txt``) is
+    returned, without test and quality tools.
+    """
+
+    sets = dependency_sets(django_version)
+    specs = sets["runtime"] + (sets["dev"] if dev else [])
+    return list(dict.fromkeys(specs))
+
+
+def installed_distributions(venv_path: Path) -> Dict[str, int]:
+    """Map each distribution installed in ``venv_path`` to its size in bytes.
+
+    Sizes come from the ``RECORD`` files pip writes, so nothing is imported
+    from the virtualenv.
+    """
+
+    dists = {}
+    for record in venv_path.glob("lib/python*/site-packages/*.dist-info/RECORD"):
+        size = 0
+        for line in record.read_text().splitlines():
+            field = line.rsplit(",", 1)[-1]
+            if field.isdigit():
+                size += int(field)
+        dists[record.parent.name] = size
+    return dists
+
+
+def install_dependencies(
+    venv_path: Path,
+    django_version: str,
+    wheelhouse: Optional[Path] = None,
+    dev: bool = True,
+) -> Dict[str, Dict[str, int]]:
+    """Install Django and common packages into ``venv_path``.
+
+    The runtime set is installed first, then (unless ``dev`` is false) the
+    development tools, so each set's footprint can be measured.
+
+    Parameters
+    ----------
+    venv_path:
+        Target virtual environment.
+    django_version:
+        Django version requested by the user.
+    wheelhouse:
+        Directory with prefetched wheels. When given, the install runs offline
+        from it and only falls back to the package index if a wheel is missing.
+    dev:
+        Whether to install the development set (tests, formatters, hooks).
+
+    Returns
+    -------
+    dict
+        For each installed set, ``added_packages`` and ``added_bytes``: the
+        distributions that were not in the virtualenv before the set was
+        installed (including transitive dependencies) and their size. On a
+        reused virtualenv that already holds a set, both are 0.
+    """
+
+    sets = dependency_sets(django_version)
+    report = {}
+    for set_name in ["runtime", "dev"] if dev else ["runtime"]:
+        before = installed_distributions(venv_path)
+        specs = " ".join(shlex.quote(spec) for spec in sets[set_name])
+        _pip_install(venv_path, specs, wheelhouse)
+        added = {
+            name: size
+            for name, size in installed_distributions(venv_path).items()
+            if name not in before
+        }
+        report[set_name] = {
+            "added_packages": len(added),
+            "added_bytes": sum(added.values()),
+        }
+    return report
+
+
+def _pip_install(venv_path: Path, specs: str, wheelhouse: Optional[Path]) -> None:
+    if wheelhouse is not None:
+        try:
+            run(
+                f"{venv_path}/bin/pip install --no-index "
+                f"--find-links {shlex.quote(str(wheelhouse))} {specs}"
+            )
+            return
+        except subprocess.CalledProcessError:
+            click.echo("Prefetched wheels incomplete; using the package index.")
+    run(f"{venv_path}/bin/pip install {specs}")
 
 
-def initialize_git() -> None:
-    """Initialize a git repository with a standard Python ``.gitignore``."""
+class DependencyPrefetcher:
+    """Build wheels for the dependency set in the background.
 
-    run("git init")
-    gitignore_src = TEMPLATES_DIR / "Python.gitignore"
-    if gitignore_src.exists():
-        copyfile(gitignore_src, "Python.gitignore")
-    run("git add . && git commit -m 'bootstrap'")
+    The prefetch starts while the user is still answering prompts. Once the
+    Django version is known, :meth:`result` retargets the download if needed
+    and waits for it, so :func:`install_dependencies` can install offline from
+    the wheelhouse. With ``dev=False`` only the runtime set is downloaded.
+    Set ``INIT_DJANGO_NO_PREFETCH`` to disable it; it is also disabled while
+    commands are recorded or replayed.
+    """
+
+    def __init__(self, wheelhouse: Path = WHEELHOUSE_DIR) -> None:
+        self.wheelhouse = wheelhouse
+        self.django_version: Optional[str] = None
+        self.dev = True
+        self._proc: Optional[subprocess.Popen] = None
+
+    def start(
+        self, django_version: str = DEFAULT_DJANGO_VERSION, dev: bool = True
+    ) -> None:
+        """Start (or restart) prefetching wheels for ``django_version``.
+
+        Wheels finished by an earlier run are reused from the wheelhouse, so
+        retargeting only downloads what is missing.
+        """
+
+        if os.environ.get("INIT_DJANGO_NO_PREFETCH"):
+            return
+        if not get_backend().supports_prefetch:
+            return
+        if (
+            self._proc is not None
+            and self.django_version == django_version
+            and self.dev == dev
+        ):
+            return
+        self.cancel()
+        self.django_version = django_version
+        self.dev = dev
+        try:
+            self.wheelhouse.mkdir(parents=True, exist_ok=True)
+            self._proc = subprocess.Popen(
+                [
+                    "python3",
+                    "-m",
+                    "pip",
+                    "wheel",
+                    "--quiet",
+                    "--wheel-dir",
+                    str(self.wheelhouse),
+                    "--find-links",
+                    str(self.wheelhouse),
+                    *dependency_specs(django_version, dev=dev),
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError:
+            self._proc = None
+
+    def cancel(self) -> None:
+        """Stop a running prefetch, e.g. when dependencies are skipped."""
+
+        proc, self._proc = self._proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def result(
+        self, django_version: str, timeout: Optional[float] = None, dev: bool = True
+    ) -> Optional[Path]:
+        """Wait for the prefetch of ``django_version`` and return the wheelhouse.
+
+        Returns ``None`` when prefetching is disabled, failed or timed out, in
+        which case the caller installs from the package index as usual.
+        """
+
+        self.start(django_version, dev=dev)
+        proc = self._proc
+        if proc is None:
+            return None
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.cancel()
+            return None
+        self._proc = None
+        return self.wheelhouse if returncode == 0 else None
+
+
+# Patterns every bootstrap repository must ignore; appended to an existing
+# ``.gitignore`` that lacks them.
+GITIGNORE_ESSENTIALS = [
+    ".venv/",
+    ".env",
+    "__pycache__/",
+    "*.py[cod]",
+    ".pytest_cache/",
+    ".mypy_cache/",
+    "staticfiles/",
+    "media/",
+    "*.sqlite3",
+    "*.sqlite3-journal",
+    ".init-django-stage-*/",
+]
+
+# Largest initial commit accepted, in MB (``INIT_DJANGO_GIT_BUDGET_MB``)
+GIT_COMMIT_BUDGET_MB = 10
+
+
+def install_gitignore(base: Path) -> None:
+    """Create ``.gitignore`` from the template, or complete an existing one."""
+
+    target = base / ".gitignore"
+    if not target.exists():
+        with staged_project(base) as stage:
+            stage.copy(TEMPLATES_DIR / "Python.gitignore", ".gitignore")
+        return
+    present = {line.strip() for line in target.read_text().splitlines()}
+    missing = [p for p in GITIGNORE_ESSENTIALS if p not in present]
+    if missing:
+        content = target.read_text().rstrip("\n")
+        with staged_project(base) as stage:
+            stage.write(
+                ".gitignore",
+                f"{content}\n\n# Added by tribeca-django-init\n"
+                + "\n".join(missing)
+                + "\n",
+            )
+
+
+def initialize_git(base: Optional[Path] = None, json_mode: bool = False) -> Dict:
+    """Initialize a git repository and commit the bootstrap files.
+
+    Both CLIs call this last, once the project, settings, apps, README and
+    ``.env`` exist, so the commit holds the whole generated tree. A
+    ``.gitignore`` is installed first so the virtualenv, collected static
+    files, SQLite databases and caches are never hashed. Only the files git
+    reports as untracked and not ignored are staged. The commit is refused
+    when they exceed ``INIT_DJANGO_GIT_BUDGET_MB`` (default
+    :data:`GIT_COMMIT_BUDGET_MB`), which usually means an ignore rule is
+    missing; the new ``.git`` directory is then removed, so the next run
+    initializes the repository again.
+
+    Returns
+    -------
+    dict
+        ``files`` and ``bytes`` committed.
+    """
+
+    base = base or Path.cwd()
+    run("git init -q")
+    install_gitignore(base)
+    listing = get_backend().run("git ls-files -z --others --exclude-standard")
+    sizes = {}
+    for name in listing.stdout.split("\0"):
+        path = base / name
+        if name and (path.is_file() or path.is_symlink()):
+            sizes[name] = path.lstat().st_size
+    total = sum(sizes.values())
+
+    budget_mb = float(
+        os.environ.get("INIT_DJANGO_GIT_BUDGET_MB") or GIT_COMMIT_BUDGET_MB
+    )
+    if total > budget_mb * 1024 * 1024:
+        largest = sorted(sizes, key=sizes.__getitem__, reverse=True)[:5]
+        msg = (
+            f"Initial commit would add {len(sizes)} files ({total / 1024 / 1024:.1f}"
+            f" MB), over the {budget_mb:g} MB budget. Largest: {', '.join(largest)}."
+            " Add ignore rules to .gitignore or raise INIT_DJANGO_GIT_BUDGET_MB."
+        )
+        if json_mode:
+            emit_json_event(
+                "git",
+                "error",
+                msg,
+                {"files": len(sizes), "bytes": total, "largest": largest},
+                error_code="GIT_COMMIT_TOO_LARGE",
+            )
+        else:
+            click.echo(f"❌ {msg}")
+        shutil.rmtree(base / ".git", ignore_errors=True)
+        raise click.ClickException(msg)
+
+    run(
+        "git ls-files -z --others --exclude-standard"
+        " | git add --pathspec-from-file=- --pathspec-file-nul"
+    )
+    run("git commit -q -m 'bootstrap'")
+    return {"files": len(sizes), "bytes": total}
 
 
 def start_django_project(venv_path: Path, base: Path, json_mode: bool = False) -> None:
@@ -148,37 +467,291 @@ def start_django_project(venv_path: Path, base: Path, json_mode: bool = False) -
     run(f"{django_admin} startproject config .")
 
 
+# ``ioctl`` request number of ``FICLONE`` (``_IOW(0x94, 9, int)``) on Linux.
+FICLONE = 0x40049409
+
+
+def clone_file(src: Path, dest: Path) -> None:
+    """Copy ``src`` to ``dest``, sharing data blocks when possible.
+
+    A reflink (``FICLONE``) is attempted first so copy-on-write filesystems
+    such as Btrfs or XFS clone the file without duplicating its data. Any
+    other filesystem falls back to :func:`shutil.copyfile`, which already uses
+    ``sendfile``/``copy_file_range`` in the kernel where available.
+    """
+
+    try:
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+            fcntl.ioctl(fdest.fileno(), FICLONE, fsrc.fileno())
+        return
+    except (ImportError, OSError):
+        pass
+    copyfile(src, dest)
+
+
+class ProjectStage:
+    """Collect generated files in a staging directory before touching ``base``.
+
+    The staging directory lives inside ``base`` so the final :meth:`commit`
+    only needs ``rename`` calls on the same filesystem. Directories that do not
+    exist yet in ``base`` are moved in a single rename, existing files are
+    atomically replaced, and nothing is written to the working tree until
+    every file has been staged successfully.
+
+    A stage covers one generation step, not the whole bootstrap: each
+    ``create_*`` helper commits its own stage, and the Django commands run in
+    between (``startproject``, ``startapp``, ``migrate``) write to ``base``
+    directly. A failure rolls back the step that raised, while the output of
+    earlier steps stays in place and is skipped on the next run.
+    """
+
+    def __init__(self, base: Path) -> None:
+        self.base = base
+        self.root = Path(tempfile.mkdtemp(prefix=".init-django-stage-", dir=base))
+
+    def path(self, rel: Union[str, Path]) -> Path:
+        """Return the staged location of ``rel``, creating parent folders."""
+
+        target = self.root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        return target
+
+    def copy(self, src: Path, rel: Union[str, Path]) -> None:
+        """Stage a copy of ``src`` at ``rel``."""
+
+        dest = self.path(rel)
+        clone_file(src, dest)
+        shutil.copymode(src, dest)
+
+    def copy_tree(self, src: Path, rel: Union[str, Path]) -> None:
+        """Stage every file below ``src`` at ``rel``, dropping ``.tpl`` suffixes."""
+
+        for path in sorted(src.rglob("*")):
+            if path.is_file() and "__pycache__" not in path.parts:
+                target = Path(rel, path.relative_to(src))
+                if target.suffix == ".tpl":
+                    target = target.with_suffix("")
+                self.copy(path, target)
+
+    def write(self, rel: Union[str, Path], content: str) -> None:
+        """Stage a text file with ``content`` at ``rel``."""
+
+        self.path(rel).write_text(content)
+
+    def commit(self) -> List[Path]:
+        """Move every staged entry into ``base`` and return the moved paths."""
+
+        moved: List[Path] = []
+        self._merge(self.root, self.base, moved)
+        self.discard()
+        return moved
+
+    def discard(self) -> None:
+        """Remove the staging directory and anything left inside it."""
+
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _merge(self, src_dir: Path, dest_dir: Path, moved: List[Path]) -> None:
+        for entry in sorted(src_dir.iterdir()):
+            target = dest_dir / entry.name
+            if entry.is_dir() and target.is_dir():
+                self._merge(entry, target, moved)
+            else:
+                os.replace(entry, target)
+                moved.append(target)
+
+
+@contextmanager
+def staged_project(base: Path) -> Iterator[ProjectStage]:
+    """Yield a :class:`ProjectStage` and commit it when the block succeeds.
+
+    If the block raises, the staging directory is discarded and ``base`` is
+    left exactly as it was.
+    """
+
+    stage = ProjectStage(base)
+    try:
+        yield stage
+    except BaseException:
+        stage.discard()
+        raise
+    stage.commit()
+
+
+# Appended to config/wsgi.py and asgi.py: answer health probes ahead of Django
+HEALTH_WRAPPER = """
+# Liveness/readiness probes skip Django's middleware (see core/health.py)
+from core.health import {wrapper}  # noqa: E402
+
+application = {wrapper}(application)
+"""
+
+
 def create_settings_package(base: Path) -> None:
-    """Generate the ``config/settings`` package from templates."""
+    """Generate the ``config/settings`` package from templates.
+
+    Besides ``base``/``dev``/``prod``, a ``test`` settings module and a
+    ``pytest.ini`` selecting it are generated so the project's test suite
+    runs in parallel with fast hashing from the start. The ``core`` app the
+    settings register in ``LOCAL_APPS`` (project-wide management commands
+    and infrastructure such as request timing, JSON logging, health probes
+    and the read-replica database router) is generated alongside.
+    ``config/wsgi.py`` and ``config/asgi.py`` are wrapped so liveness and
+    readiness probes are answered before Django's middleware.
+    """
+
+    wsgi = base / "config" / "wsgi.py"
+    asgi = base / "config" / "asgi.py"
+    with staged_project(base) as stage:
+        if not (base / "core").exists():
+            stage.copy_tree(TEMPLATES_DIR / "core", "core")
+        if not (base / "pytest.ini").exists():
+            stage.copy(TEMPLATES_DIR / "pytest.ini.tpl", "pytest.ini")
+        for fname in ["base.py", "dev.py", "prod.py", "test.py"]:
+            stage.copy(
+                TEMPLATES_DIR / "settings" / f"{fname}.tpl",
+                Path("config", "settings", fname),
+            )
+        stage.write(
+            Path("config", "settings", "__init__.py"),
+            "from .dev import *  # default to dev",
+        )
+        stage.write(
+            Path("config", "wsgi.py"),
+            wsgi.read_text().replace("config.settings", "config.settings.dev")
+            + HEALTH_WRAPPER.format(wrapper="HealthCheckWSGI"),
+        )
+        if asgi.exists():
+            stage.write(
+                Path("config", "asgi.py"),
+                asgi.read_text() + HEALTH_WRAPPER.format(wrapper="HealthCheckASGI"),
+            )
+
 
-    settings_dir = base / "config" / "settings"
-    os.makedirs(settings_dir, exist_ok=True)
-    for fname in ["base.py", "dev.py", "prod.py"]:
-        copyfile(TEMPLATES_DIR / "settings" / f"{fname}.tpl", settings_dir / fname)
-    with open(settings_dir / "__init__.py", "w") as fh:
-        fh.write("from .dev import *  # default to dev")
-    with open(base / "config" / "wsgi.py", "r+") as fh:
-        content = fh.read()
-        fh.seek(0)
-        fh.write(content.replace("config.settings", "config.settings.dev"))
+def create_tasks_module(base: Path) -> None:
+    """Scaffold background tasks in the ``core`` app and their settings.
 
+    Adds ``core.tasks`` (task API with database and Redis backends), the
+    ``QueuedTask`` model and migration, the ``run_worker`` management command
+    and a ``TASKS`` block appended to ``config/settings/base.py``.
+    """
+
+    settings_file = base / "config" / "settings" / "base.py"
+    with staged_project(base) as stage:
+        stage.copy_tree(TEMPLATES_DIR / "tasks" / "core", "core")
+        stage.write(
+            Path("config", "settings", "base.py"),
+            settings_file.read_text()
+            + (TEMPLATES_DIR / "tasks" / "settings.py.tpl").read_text(),
+        )
 
-def create_app(venv_path: Path, app: str) -> None:
-    """Create a Django app named ``app`` using the given virtualenv."""
 
-    run(f"{venv_path}/bin/python manage.py startapp {app}")
+MANAGE_BATCH = Path(__file__).parent / "manage_batch.py"
 
 
-def apply_migrations(venv_path: Path) -> None:
-    """Apply initial Django migrations using ``venv_path``."""
+def parse_app_names(value: str) -> List[str]:
+    """Split a comma or whitespace separated list of app names.
+
+    Duplicates are dropped while keeping the order given by the user.
+    """
 
-    run(f"{venv_path}/bin/python manage.py migrate")
+    names = value.replace(",", " ").split()
+    return list(dict.fromkeys(names))
+
+
+def run_management_batch(
+    venv_path: Path,
+    apps: List[str],
+    makemigrations: bool = False,
+    migrate: bool = False,
+    settings_file: Optional[Path] = None,
+) -> None:
+    """Run ``startapp``/``makemigrations``/``migrate`` in one Django process.
+
+    Parameters
+    ----------
+    venv_path:
+        Virtualenv whose interpreter executes :mod:`init_django.manage_batch`.
+    apps:
+        Apps to create with ``startapp``.
+    makemigrations:
+        Run ``makemigrations`` for ``apps`` after creating them.
+    migrate:
+        Run ``migrate`` at the end.
+    settings_file:
+        Settings module whose ``LOCAL_APPS`` list should receive ``apps``.
+    """
+
+    args = [f"--startapp {shlex.quote(app)}" for app in apps]
+    if settings_file is not None:
+        args.append(f"--register-in {shlex.quote(str(settings_file))}")
+    if makemigrations:
+        args.append("--makemigrations")
+    if migrate:
+        args.append("--migrate")
+    run(f"{venv_path}/bin/python {shlex.quote(str(MANAGE_BATCH))} {' '.join(args)}")
+
+
+def create_apps(
+    venv_path: Path, base: Path, apps: List[str], migrate: bool = False
+) -> None:
+    """Create ``apps``, register them in ``LOCAL_APPS`` and optionally migrate.
+
+    Everything runs inside a single virtualenv Python process, so Django boots
+    once regardless of how many apps are created.
+    """
+
+    run_management_batch(
+        venv_path,
+        apps,
+        makemigrations=migrate,
+        migrate=migrate,
+        settings_file=base / "config" / "settings" / "base.py",
+    )
+
+
+def precompile_bytecode(venv_path: Path, base: Path) -> None:
+    """Compile the project and its virtualenv to bytecode in parallel.
+
+    ``compileall`` runs with one worker per CPU and skips files whose ``.pyc``
+    is already current, so the dependencies pip compiled at install time cost
+    only a ``stat``. Compilation errors are reported but do not abort the
+    bootstrap.
+    """
+
+    run(
+        f"{venv_path}/bin/python -m compileall -q -j 0 "
+        f"-x '/\\.git/|/\\.init-django-stage-' {shlex.quote(str(base))}",
+        check=False,
+    )
 
 
 def create_readme(base: Path) -> None:
     """Create ``README.md`` from the packaged template."""
 
-    copyfile(TEMPLATES_DIR / "readme.md.tpl", base / "README.md")
+    with staged_project(base) as stage:
+        stage.copy(TEMPLATES_DIR / "readme.md.tpl", "README.md")
+
+
+def create_requirements_file(base: Path) -> bool:
+    """Copy the requirement files into ``base`` if missing.
+
+    ``requirements/base.txt``, ``prod.txt`` and ``dev.txt`` hold the runtime
+    and development sets; the top-level ``requirements.txt`` points deploy
+    platforms at ``prod.txt``. Returns ``True`` when files were created.
+    """
+
+    created = False
+    with staged_project(base) as stage:
+        if not (base / "requirements").exists():
+            stage.copy_tree(TEMPLATES_DIR / "requirements", "requirements")
+            created = True
+        if not (base / "requirements.txt").exists():
+            stage.copy(TEMPLATES_DIR / "requirements.txt", "requirements.txt")
+            created = True
+    return created
 
 
 def create_env_file(base: Path) -> None:
@@ -187,4 +760,5 @@ def create_env_file(base: Path) -> None:
     src = TEMPLATES_DIR / ".env.example"
     dest = base / ".env"
     if not dest.exists() and src.exists():
-        copyfile(src, dest)
+        with staged_project(base) as stage:
+            stage.copy(src, ".env")
@@ -4,23 +4,26 @@ Always keep command compatibility and semantics in sync with ``cli_user.py``.
 
 import sys
 from pathlib import Path
-from shutil import copyfile
 from typing import Optional
 
 import click
 
 from init_django import print_install_success
 from init_django.cli_common import (
-    TEMPLATES_DIR,
-    apply_migrations,
-    create_app,
+    DEFAULT_DJANGO_VERSION,
+    DependencyPrefetcher,
+    create_apps,
     create_env_file,
     create_readme,
+    create_requirements_file,
     create_settings_package,
+    create_tasks_module,
     create_virtualenv,
     emit_json_event,
     initialize_git,
     install_dependencies,
+    parse_app_names,
+    precompile_bytecode,
     run,
     start_django_project,
 )
@@ -36,27 +39,47 @@ from init_django.cli_common import (
 @click.option("--venv", type=click.Choice(["reuse", "recreate", "skip"]), default=None)
 @click.option("--install-deps", type=click.Choice(["yes", "no"]), default=None)
 @click.option("--django-version", default=None)
+@click.option(
+    "--dev-deps",
+    type=click.Choice(["yes", "no"]),
+    default=None,
+    help="Also install development tools (default: yes); 'no' installs runtime only",
+)
 @click.option("--git-init", type=click.Choice(["yes", "no"]), default=None)
 @click.option("--project", type=click.Choice(["yes", "no"]), default=None)
 @click.option("--settings", type=click.Choice(["yes", "no"]), default=None)
-@click.option("--app-name", default=None)
+@click.option(
+    "--tasks",
+    type=click.Choice(["yes", "no"]),
+    default=None,
+    help="Scaffold a database-backed background task queue in the core app",
+)
+@click.option(
+    "--app-name",
+    default=None,
+    help="App name, or a comma-separated list of apps to create",
+)
 @click.option("--app-create", type=click.Choice(["yes", "no"]), default=None)
 @click.option("--migrate", type=click.Choice(["yes", "no"]), default=None)
 @click.option("--readme", type=click.Choice(["yes", "no"]), default=None)
 @click.option("--env-file", type=click.Choice(["yes", "no"]), default=None)
+@click.option("--precompile", type=click.Choice(["yes", "no"]), default=None)
 def main(
     json_mode: bool,
     venv: Optional[str],
     install_deps: Optional[str],
     django_version: Optional[str],
+    dev_deps: Optional[str],
     git_init: Optional[str],
     project: Optional[str],
     settings: Optional[str],
+    tasks: Optional[str],
     app_name: Optional[str],
     app_create: Optional[str],
     migrate: Optional[str],
     readme: Optional[str],
     env_file: Optional[str],
+    precompile: Optional[str],
 ) -> None:
     """MCP/agent CLI: non-interactive, argument-driven, emits JSON."""
     try:
@@ -64,6 +87,13 @@ def main(
         base = Path.cwd()
         venv_path = base / ".venv"
         emit_json_event("start", "success", "Bootstrap started", {"cwd": str(base)})
+        # Overlap the dependency download with the virtualenv setup
+        prefetcher = DependencyPrefetcher()
+        click.get_current_context().call_on_close(prefetcher.cancel)
+        if install_deps == "yes":
+            prefetcher.start(
+                django_version or DEFAULT_DJANGO_VERSION, dev=dev_deps != "no"
+            )
 
         # 1️⃣ Virtual environment
         venv_action = venv or "reuse" if venv_path.exists() else "recreate"
@@ -107,41 +137,40 @@ def main(
                     {},
                 )
                 dj_version = "5.2.3"
-            install_dependencies(venv_path, dj_version)
+            wheelhouse = prefetcher.result(dj_version, dev=dev_deps != "no")
+            sets = install_dependencies(
+                venv_path, dj_version, wheelhouse, dev=dev_deps != "no"
+            )
             emit_json_event(
                 "dependencies",
                 "success",
                 "Dependencies installed",
-                {"django": dj_version},
+                {
+                    "django": dj_version,
+                    "prefetched": wheelhouse is not None,
+                    "sets": sets,
+                },
             )
         else:
             emit_json_event(
                 "dependencies", "skipped", "Dependency installation skipped", {}
             )
 
-        # 3. Git
-        if (base / ".git").exists():
-            emit_json_event("git", "success", "Git repository already initialized", {})
-        elif git_init == "yes":
-            initialize_git()
-            emit_json_event("git", "success", "Git initialized", {})
-        else:
-            emit_json_event("git", "skipped", "Git initialization skipped", {})
-
-        # 4. Django project
+        # 3. Django project
         if (base / "manage.py").exists():
             emit_json_event("project", "success", "Django project already exists", {})
         elif project == "yes":
             start_django_project(venv_path, base, json_mode=json_mode)
-            req_tpl = TEMPLATES_DIR / "requirements.txt"
             req_target = base / "requirements.txt"
-            if req_tpl.exists() and not req_target.exists():
-                copyfile(req_tpl, req_target)
+            if create_requirements_file(base):
                 emit_json_event(
                     "requirements",
                     "success",
-                    "requirements.txt created from template",
-                    {"path": str(req_target)},
+                    "Requirement files created from templates",
+                    {
+                        "path": str(req_target),
+                        "directory": str(base / "requirements"),
+                    },
                 )
             settings_dir = base / "config" / "settings"
             if settings_dir.exists():
@@ -157,31 +186,56 @@ def main(
                     "settings",
                     "success",
                     "Settings package created",
-                    {"path": str(settings_dir)},
+                    {"path": str(settings_dir), "core_app": str(base / "core")},
                 )
             else:
                 emit_json_event(
                     "settings", "skipped", "Skipped settings package creation", {}
                 )
-            # App
-            app = app_name or "users"
-            if (base / app).exists():
+            # Background tasks
+            if (base / "core" / "tasks.py").exists():
                 emit_json_event(
-                    "app", "success", f"App '{app}' already exists", {"name": app}
+                    "tasks", "success", "Background tasks already scaffolded", {}
                 )
-            elif app_create == "yes":
-                create_app(venv_path, app)
+            elif tasks == "yes" and (base / "core").exists() and settings_dir.exists():
+                create_tasks_module(base)
+                emit_json_event(
+                    "tasks",
+                    "success",
+                    "Background tasks scaffolded",
+                    {"path": str(base / "core" / "tasks.py")},
+                )
+            else:
+                emit_json_event("tasks", "skipped", "Skipped background tasks", {})
+            # Apps
+            new_apps = []
+            for app in parse_app_names(app_name or "users"):
+                if (base / app).exists():
+                    emit_json_event(
+                        "app", "success", f"App '{app}' already exists", {"name": app}
+                    )
+                else:
+                    new_apps.append(app)
+            if new_apps and app_create == "yes":
+                create_apps(venv_path, base, new_apps, migrate=migrate == "yes")
+                for app in new_apps:
+                    emit_json_event(
+                        "app", "success", f"App '{app}' created", {"name": app}
+                    )
                 if migrate == "yes":
-                    apply_migrations(venv_path)
                     emit_json_event(
                         "migrations", "success", "Initial migrations applied", {}
                     )
                 else:
                     emit_json_event("migrations", "skipped", "Skipped migrations", {})
             else:
-                emit_json_event(
-                    "app", "skipped", f"Skipped creation of app '{app}'", {"name": app}
-                )
+                for app in new_apps:
+                    emit_json_event(
+                        "app",
+                        "skipped",
+                        f"Skipped creation of app '{app}'",
+                        {"name": app},
+                    )
             # README
             if (base / "README.md").exists():
                 emit_json_event("readme", "success", "README.md already exists", {})
@@ -214,8 +268,32 @@ def main(
                 )
             else:
                 emit_json_event("env_file", "skipped", "Skipped .env creation", {})
+
+            # Bytecode
+            if precompile == "yes" and (venv_path / "bin" / "python").exists():
+                precompile_bytecode(venv_path, base)
+                emit_json_event(
+                    "bytecode",
+                    "success",
+                    "Project and virtualenv precompiled to bytecode",
+                    {"path": str(base)},
+                )
+            else:
+                emit_json_event(
+                    "bytecode", "skipped", "Skipped bytecode precompilation", {}
+                )
         else:
             emit_json_event("project", "skipped", "Skipped Django project creation", {})
+
+        # Git, last so the first commit holds every generated file
+        if (base / ".git").exists():
+            emit_json_event("git", "success", "Git repository already initialized", {})
+        elif git_init == "yes":
+            commit = initialize_git(base, json_mode=json_mode)
+            emit_json_event("git", "success", "Git initialized", commit)
+        else:
+            emit_json_event("git", "skipped", "Git initialization skipped", {})
+
         emit_json_event(
             "done",
             "success",
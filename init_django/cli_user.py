@@ -3,21 +3,24 @@ Always keep command compatibility and semantics in sync with ``cli_mcp.py``.
 """
 
 from pathlib import Path
-from shutil import copyfile
 
 import click
 
 from init_django import print_install_success
 from init_django.cli_common import (
-    TEMPLATES_DIR,
-    apply_migrations,
-    create_app,
+    DEFAULT_DJANGO_VERSION,
+    DependencyPrefetcher,
+    create_apps,
     create_env_file,
     create_readme,
+    create_requirements_file,
     create_settings_package,
+    create_tasks_module,
     create_virtualenv,
     initialize_git,
     install_dependencies,
+    parse_app_names,
+    precompile_bytecode,
     run,
     start_django_project,
 )
@@ -29,6 +32,11 @@ def main() -> None:
     print_install_success()
     base = Path.cwd()
     venv = base / ".venv"
+    # Download the runtime set, needed by every install, while the user reads
+    # the prompts; development tools are only fetched once they are chosen
+    prefetcher = DependencyPrefetcher()
+    prefetcher.start(dev=False)
+    click.get_current_context().call_on_close(prefetcher.cancel)
     click.echo("\nTribeca Django Init — Interactive Django Bootstrap\n")
 
     # 1️⃣ Virtual environment
@@ -73,7 +81,9 @@ def main() -> None:
         default="1",
     )
     if dep_choice == "1":
-        django_version = click.prompt("🔢 Django version to install", default="5.2.3")
+        django_version = click.prompt(
+            "🔢 Django version to install", default=DEFAULT_DJANGO_VERSION
+        )
         try:
             parts = django_version.split(".")
             major = int(parts[0])
@@ -85,49 +95,47 @@ def main() -> None:
         except Exception:
             click.echo("⚠️  Invalid Django version. Using default 5.2.3.")
             django_version = "5.2.3"
-        install_dependencies(venv, django_version)
-    else:
-        click.echo("Skipping dependency installation.")
-
-    # 3. Git
-    if (base / ".git").exists():
-        click.echo("Git repository already initialized.")
-    else:
-        git_choice = click.prompt(
-            "3️⃣  Git repository setup\n1\u20e3  Initialize git repository\n"
-            "2\u20e3  Skip this step\nEnter your choice:",
+        set_choice = click.prompt(
+            "🧰 Dependency sets\n"
+            "1\u20e3  Runtime and development tools (pytest, black, pre-commit)\n"
+            "2\u20e3  Runtime only (production installs)\nEnter your choice:",
             type=click.Choice(["1", "2"]),
             default="1",
         )
-        if git_choice == "1":
-            initialize_git()
-        else:
-            click.echo("Skipping git initialization.")
+        dev = set_choice == "1"
+        report = install_dependencies(
+            venv, django_version, prefetcher.result(django_version, dev=dev), dev=dev
+        )
+        for set_name, stats in report.items():
+            click.echo(
+                f"{set_name}: {stats['added_packages']} packages added "
+                f"({stats['added_bytes'] / 1_000_000:.1f} MB) to the virtualenv"
+            )
+    else:
+        prefetcher.cancel()
+        click.echo("Skipping dependency installation.")
 
-    # 4. Django project
+    # 3. Django project
     if (base / "manage.py").exists():
         click.echo("Django project already exists in this folder.")
     else:
         proj_choice = click.prompt(
-            "4️⃣  Django project setup\n1\u20e3  Create Django project (config)\n"
+            "3️⃣  Django project setup\n1\u20e3  Create Django project (config)\n"
             "2\u20e3  Skip this step\nEnter your choice:",
             type=click.Choice(["1", "2"]),
             default="1",
         )
         if proj_choice == "1":
             start_django_project(venv, base)
-            req_tpl = TEMPLATES_DIR / "requirements.txt"
-            req_target = base / "requirements.txt"
-            if req_tpl.exists() and not req_target.exists():
-                copyfile(req_tpl, req_target)
-                click.echo("requirements.txt created from template.")
+            if create_requirements_file(base):
+                click.echo("requirements.txt and requirements/ created from templates.")
 
             settings_dir = base / "config" / "settings"
             if settings_dir.exists():
                 click.echo("Settings package already exists.")
             else:
                 settings_choice = click.prompt(
-                    "5️⃣  Settings package setup\n"
+                    "4️⃣  Settings package setup\n"
                     "1️⃣  Create settings package (config/settings)\n"
                     "2️⃣  Skip this step\nEnter your choice:",
                     type=click.Choice(["1", "2"]),
@@ -138,32 +146,54 @@ def main() -> None:
                 else:
                     click.echo("Skipping settings package creation.")
 
-            app_name = click.prompt(
-                "Name of the first app (e.g., users)", default="users"
+            if (base / "core" / "tasks.py").exists():
+                click.echo("Background tasks already scaffolded.")
+            elif (base / "core").exists() and settings_dir.exists():
+                tasks_choice = click.prompt(
+                    "⏱️  Background tasks\n"
+                    "1️⃣  Scaffold a database-backed task queue and worker\n"
+                    "2️⃣  Skip this step\nEnter your choice:",
+                    type=click.Choice(["1", "2"]),
+                    default="1",
+                )
+                if tasks_choice == "1":
+                    create_tasks_module(base)
+                    click.echo("Background tasks scaffolded in core/tasks.py.")
+                else:
+                    click.echo("Skipping background tasks.")
+
+            app_names = parse_app_names(
+                click.prompt(
+                    "Names of the apps, comma-separated (e.g., users,billing)",
+                    default="users",
+                )
             )
-            if (base / app_name).exists():
-                click.echo(f"App '{app_name}' already exists.")
-            else:
+            new_apps = []
+            for app_name in app_names:
+                if (base / app_name).exists():
+                    click.echo(f"App '{app_name}' already exists.")
+                else:
+                    new_apps.append(app_name)
+            if new_apps:
+                apps_label = ", ".join(f"'{app}'" for app in new_apps)
                 app_choice = click.prompt(
-                    f"6️⃣  App creation\n1️⃣  Create app '{app_name}'\n2️⃣  "
+                    f"5️⃣  App creation\n1️⃣  Create app(s) {apps_label}\n2️⃣  "
                     "Skip this step\nEnter your choice:",
                     type=click.Choice(["1", "2"]),
                     default="1",
                 )
                 if app_choice == "1":
-                    create_app(venv, app_name)
                     migrations_choice = click.prompt(
-                        "7️⃣  Run migrations\n1️⃣  Run initial migrations\n"
+                        "6️⃣  Run migrations\n1️⃣  Run initial migrations\n"
                         "2️⃣  Skip this step\nEnter your choice:",
                         type=click.Choice(["1", "2"]),
                         default="1",
                     )
-                    if migrations_choice == "1":
-                        apply_migrations(venv)
-                    else:
+                    create_apps(venv, base, new_apps, migrate=migrations_choice == "1")
+                    if migrations_choice != "1":
                         click.echo("Skipping migrations.")
                 else:
-                    click.echo(f"Skipping creation of app '{app_name}'.")
+                    click.echo(f"Skipping creation of app(s) {apps_label}.")
 
             if (base / "README.md").exists():
                 click.echo("README.md already exists.")
@@ -175,7 +205,7 @@ def main() -> None:
                 click.echo(".env already exists.")
             else:
                 env_prompt = (
-                    "8️⃣  Create .env from .env.example?\n"
+                    "7️⃣  Create .env from .env.example?\n"
                     "1️⃣  Create file\n"
                     "2️⃣  Skip this step\n"
                     "Enter your choice:"
@@ -190,9 +220,43 @@ def main() -> None:
                     click.echo(".env file created from template.")
                 else:
                     click.echo("Skipping .env creation.")
+
+            # Spare the first server boot from compiling every module
+            if (venv / "bin" / "python").exists():
+                precompile_choice = click.prompt(
+                    "8️⃣  Precompile bytecode\n"
+                    "1️⃣  Compile the project and .venv to bytecode\n"
+                    "2️⃣  Skip this step\nEnter your choice:",
+                    type=click.Choice(["1", "2"]),
+                    default="1",
+                )
+                if precompile_choice == "1":
+                    precompile_bytecode(venv, base)
+                    click.echo("Project and virtualenv precompiled to bytecode.")
+                else:
+                    click.echo("Skipping bytecode precompilation.")
         else:
             click.echo("Skipping Django project creation.")
 
+    # 9. Git, last so the first commit holds every generated file
+    if (base / ".git").exists():
+        click.echo("Git repository already initialized.")
+    else:
+        git_choice = click.prompt(
+            "9️⃣  Git repository setup\n1\u20e3  Initialize git repository\n"
+            "2\u20e3  Skip this step\nEnter your choice:",
+            type=click.Choice(["1", "2"]),
+            default="1",
+        )
+        if git_choice == "1":
+            commit = initialize_git(base)
+            click.echo(
+                f"Committed {commit['files']} files "
+                f"({commit['bytes'] / 1024:.1f} KB) to a new git repository."
+            )
+        else:
+            click.echo("Skipping git initialization.")
+
     click.echo(
         f"\n✅ Project initialization/interactive flow completed in {base.resolve()}\n"
     )
@@ -0,0 +1,331 @@
+"""Pluggable execution backends for the shell commands run by the bootstrap.
+
+:func:`init_django.cli_common.run` delegates every command to the active
+backend:
+
+* :class:`SubprocessBackend` runs commands for real (the default).
+* :class:`RecordingBackend` runs them for real and writes a transcript with
+  each command, its exit code, its output and the files it created, changed or
+  removed under the working directory.
+* :class:`ReplayBackend` plays a transcript back without running anything,
+  recreating the recorded filesystem effects, so both CLI interfaces can be
+  exercised offline in seconds.
+
+The backend is chosen with ``INIT_DJANGO_COMMANDS`` (``real``, ``record`` or
+``replay``) and ``INIT_DJANGO_TRANSCRIPT`` (transcript path), or
+programmatically with :func:`set_backend`.
+"""
+
+import base64
+import json
+import os
+import shutil
+import subprocess
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+TRANSCRIPT_VERSION = 1
+
+# Placeholders keep transcripts independent of the machine they were recorded on
+CWD_TOKEN = "@@CWD@@"
+PACKAGE_TOKEN = "@@PKG@@"
+PACKAGE_DIR = str(Path(__file__).resolve().parent)
+# Installation of the interpreter running the bootstrap; virtualenvs link to it
+PYTHON_TOKEN = "@@PYTHON@@"
+PYTHON_PREFIX = os.path.realpath(sys.base_prefix)
+
+# Output lines revealing where pip found packages on the recording machine
+# (configured indexes, local wheel directories); the CLI never reads them.
+MACHINE_LINE_PREFIXES = (
+    "Looking in indexes:",
+    "Looking in links:",
+    "Processing /",
+    "WARNING: Location 'file:",
+)
+
+# Paths (relative to the working directory) recorded as bare directories:
+# their content is large, machine specific and never inspected by the CLI.
+DEFAULT_EXCLUDES = (".git", ".venv/include", ".venv/lib", ".venv/lib64")
+
+# Command output longer than this is stored compressed
+OUTPUT_INLINE_LIMIT = 2000
+
+Entry = Tuple[Any, ...]
+
+
+class TranscriptMismatchError(RuntimeError):
+    """Raised when a replayed run diverges from its transcript."""
+
+
+class SubprocessBackend:
+    """Run commands through the shell with :func:`subprocess.run`."""
+
+    #: Whether background work such as the dependency prefetch may run
+    supports_prefetch = True
+
+    def run(self, cmd: str, check: bool = True) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            cmd, shell=True, check=check, capture_output=True, text=True
+        )
+
+
+class RecordingBackend(SubprocessBackend):
+    """Run commands for real and append them to a transcript file.
+
+    The transcript is rewritten after every command so an interrupted run
+    still leaves a usable (partial) recording behind.
+    """
+
+    supports_prefetch = False
+
+    def __init__(self, path: Path, excludes: Tuple[str, ...] = DEFAULT_EXCLUDES):
+        self.path = Path(path)
+        self.excludes = excludes
+        self.commands: List[Dict[str, Any]] = []
+        self._save()
+
+    def run(self, cmd: str, check: bool = True) -> subprocess.CompletedProcess:
+        cwd = Path.cwd()
+        before = snapshot(cwd, self.excludes)
+        completed = super().run(cmd, check=False)
+        after = snapshot(cwd, self.excludes)
+        self.commands.append(
+            {
+                "cmd": _encode_text(cmd),
+                "returncode": completed.returncode,
+                "stdout": _encode_output(completed.stdout or ""),
+                "stderr": _encode_output(completed.stderr or ""),
+                "effects": _capture_effects(cwd, before, after),
+            }
+        )
+        self._save()
+        if check and completed.returncode:
+            raise subprocess.CalledProcessError(
+                completed.returncode, cmd, completed.stdout, completed.stderr
+            )
+        return completed
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        payload = {"version": TRANSCRIPT_VERSION, "commands": self.commands}
+        tmp.write_text(json.dumps(payload, indent=1) + "\n")
+        os.replace(tmp, self.path)
+
+
+class ReplayBackend:
+    """Serve commands from a transcript instead of executing them."""
+
+    supports_prefetch = False
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        payload = json.loads(self.path.read_text())
+        if payload.get("version") != TRANSCRIPT_VERSION:
+            raise TranscriptMismatchError(
+                f"Unsupported transcript version in {self.path}"
+            )
+        self.commands: List[Dict[str, Any]] = payload["commands"]
+        self.position = 0
+
+    def run(self, cmd: str, check: bool = True) -> subprocess.CompletedProcess:
+        if self.position >= len(self.commands):
+            raise TranscriptMismatchError(
+                f"Unexpected command {cmd!r}: {self.path} has no more entries. "
+                "Re-record the transcript."
+            )
+        entry = self.commands[self.position]
+        expected = _decode_text(entry["cmd"])
+        if expected != cmd:
+            raise TranscriptMismatchError(
+                f"Command #{self.position + 1} differs from {self.path}:\n"
+                f"  expected: {expected}\n  actual:   {cmd}\n"
+                "Re-record the transcript."
+            )
+        self.position += 1
+        _apply_effects(Path.cwd(), entry["effects"])
+        stdout = _decode_output(entry["stdout"])
+        stderr = _decode_output(entry["stderr"])
+        if check and entry["returncode"]:
+            raise subprocess.CalledProcessError(
+                entry["returncode"], cmd, stdout, stderr
+            )
+        return subprocess.CompletedProcess(cmd, entry["returncode"], stdout, stderr)
+
+    def assert_finished(self) -> None:
+        """Fail if the run stopped before consuming the whole transcript."""
+
+        remaining = len(self.commands) - self.position
+        if remaining:
+            raise TranscriptMismatchError(
+                f"{remaining} recorded command(s) in {self.path} were never run"
+            )
+
+
+Backend = Union[SubprocessBackend, ReplayBackend]
+
+_backend: Optional[Backend] = None
+
+
+def get_backend() -> Backend:
+    """Return the active backend, creating it from the environment if needed."""
+
+    global _backend
+    if _backend is None:
+        mode = os.environ.get("INIT_DJANGO_COMMANDS", "real")
+        transcript = Path(os.environ.get("INIT_DJANGO_TRANSCRIPT", "transcript.json"))
+        if mode == "record":
+            _backend = RecordingBackend(transcript)
+        elif mode == "replay":
+            _backend = ReplayBackend(transcript)
+        else:
+            _backend = SubprocessBackend()
+    return _backend
+
+
+def set_backend(backend: Optional[Backend]) -> Optional[Backend]:
+    """Install ``backend`` and return the previous one.
+
+    Passing ``None`` makes the next :func:`get_backend` call read the
+    environment again.
+    """
+
+    global _backend
+    previous, _backend = _backend, backend
+    return previous
+
+
+def snapshot(root: Path, excludes: Tuple[str, ...] = DEFAULT_EXCLUDES) -> Dict:
+    """Map every path under ``root`` to a cheap signature of its state."""
+
+    entries: Dict[str, Entry] = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in list(dirnames) + filenames:
+            rel = os.path.normpath(os.path.join(rel_dir, name))
+            full = os.path.join(dirpath, name)
+            if name == "__pycache__":
+                continue
+            if os.path.islink(full):
+                entries[rel] = ("link", os.readlink(full))
+            elif os.path.isdir(full):
+                entries[rel] = ("dir",)
+            else:
+                st = os.stat(full)
+                entries[rel] = ("file", st.st_size, st.st_mtime_ns, st.st_mode)
+        # Do not descend into excluded, cache or symlinked directories
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if d != "__pycache__"
+            and not os.path.islink(os.path.join(dirpath, d))
+            and os.path.normpath(os.path.join(rel_dir, d)) not in excludes
+        ]
+    return entries
+
+
+def _capture_effects(cwd: Path, before: Dict, after: Dict) -> List[Dict[str, Any]]:
+    effects: List[Dict[str, Any]] = []
+    removed = sorted(set(before) - set(after))
+    for rel in removed:
+        if os.path.dirname(rel) not in removed:
+            effects.append({"path": rel, "type": "removed"})
+    for rel in sorted(after):
+        state = after[rel]
+        if before.get(rel) == state:
+            continue
+        if state[0] == "dir":
+            effects.append({"path": rel, "type": "dir"})
+        elif state[0] == "link":
+            effects.append(
+                {"path": rel, "type": "link", "target": _encode_text(state[1])}
+            )
+        else:
+            data = _encode_bytes((cwd / rel).read_bytes())
+            effects.append(
+                {"path": rel, "type": "file", "mode": state[3] & 0o777, "data": data}
+            )
+    return effects
+
+
+def _apply_effects(cwd: Path, effects: List[Dict[str, Any]]) -> None:
+    for effect in effects:
+        target = cwd / effect["path"]
+        if effect["type"] == "removed" or (
+            target.is_symlink() and effect["type"] != "dir"
+        ):
+            _remove(target)
+        if effect["type"] == "dir":
+            target.mkdir(parents=True, exist_ok=True)
+        elif effect["type"] == "link":
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.symlink(_decode_text(effect["target"]), target)
+        elif effect["type"] == "file":
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(_decode_bytes(effect["data"]))
+            os.chmod(target, effect["mode"])
+
+
+def _remove(path: Path) -> None:
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.is_dir():
+        shutil.rmtree(path)
+
+
+def _locations() -> List[Tuple[str, str]]:
+    cwd = os.getcwd()
+    pairs = {(os.path.realpath(cwd), CWD_TOKEN), (cwd, CWD_TOKEN)}
+    pairs.add((PACKAGE_DIR, PACKAGE_TOKEN))
+    pairs.add((PYTHON_PREFIX, PYTHON_TOKEN))
+    # Longest paths first so nested locations are replaced correctly
+    return sorted(pairs, key=lambda pair: len(pair[0]), reverse=True)
+
+
+def _encode_text(text: str) -> str:
+    for path, token in _locations():
+        text = text.replace(path, token)
+    return text
+
+
+def _decode_text(text: str) -> str:
+    return (
+        text.replace(CWD_TOKEN, os.getcwd())
+        .replace(PACKAGE_TOKEN, PACKAGE_DIR)
+        .replace(PYTHON_TOKEN, PYTHON_PREFIX)
+    )
+
+
+def _encode_output(text: str) -> Union[str, Dict[str, str]]:
+    text = "".join(
+        line
+        for line in text.splitlines(keepends=True)
+        if not line.lstrip().startswith(MACHINE_LINE_PREFIXES)
+    )
+    # Keep short output readable in the transcript, compress the rest
+    if len(text) <= OUTPUT_INLINE_LIMIT:
+        return _encode_text(text)
+    return {"zlib": _encode_bytes(text.encode())}
+
+
+def _decode_output(value: Union[str, Dict[str, str]]) -> str:
+    if isinstance(value, dict):
+        return _decode_bytes(value["zlib"]).decode()
+    return _decode_text(value)
+
+
+def _encode_bytes(data: bytes) -> str:
+    for path, token in _locations():
+        data = data.replace(path.encode(), token.encode())
+    return base64.b64encode(zlib.compress(data, 9)).decode("ascii")
+
+
+def _decode_bytes(data: str) -> bytes:
+    raw = zlib.decompress(base64.b64decode(data))
+    return (
+        raw.replace(CWD_TOKEN.encode(), os.getcwd().encode())
+        .replace(PACKAGE_TOKEN.encode(), PACKAGE_DIR.encode())
+        .replace(PYTHON_TOKEN.encode(), PYTHON_PREFIX.encode())
+    )
@@ -0,0 +1,88 @@
+"""Run the bootstrap's Django management commands in a single process.
+
+This script is executed with the *project's* virtualenv interpreter from the
+project root (see ``cli_common.run_management_batch``). Creating apps,
+registering them in ``LOCAL_APPS`` and running ``makemigrations``/``migrate``
+used to spawn ``manage.py`` once per command, booting Django from scratch
+each time. Here Django is configured once and every step reuses it.
+
+Only the standard library and Django may be imported at module level.
+"""
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+LOCAL_APPS_RE = re.compile(r"^LOCAL_APPS = \[\n(?P<body>.*?)^\]", re.M | re.S)
+
+
+def register_local_apps(settings_file: Path, apps: List[str]) -> List[str]:
+    """Append ``apps`` to the ``LOCAL_APPS`` list in ``settings_file``.
+
+    Returns the apps that were actually added. Files without a ``LOCAL_APPS``
+    block are left untouched.
+    """
+
+    content = settings_file.read_text()
+    match = LOCAL_APPS_RE.search(content)
+    if match is None:
+        return []
+    body = match.group("body")
+    added = [app for app in apps if f'"{app}"' not in body and f"'{app}'" not in body]
+    if not added:
+        return []
+    body += "".join(f'    "{app}",\n' for app in added)
+    tmp = settings_file.with_name(f".{settings_file.name}.tmp")
+    tmp.write_text(content[: match.start("body")] + body + content[match.end("body") :])
+    os.replace(tmp, settings_file)
+    return added
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--startapp", action="append", default=[], metavar="NAME")
+    parser.add_argument(
+        "--register-in",
+        type=Path,
+        default=None,
+        help="Settings file whose LOCAL_APPS list receives the new apps",
+    )
+    parser.add_argument("--makemigrations", action="store_true")
+    parser.add_argument("--migrate", action="store_true")
+    args = parser.parse_args(argv)
+
+    # Running a script puts its own folder on sys.path, not the project root
+    sys.path.insert(0, os.getcwd())
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    import django
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.core.management.commands.startapp import Command as StartApp
+
+    # Load the project settings up front: startapp would otherwise configure
+    # empty defaults, and the apps registry must not be populated before the
+    # new app packages exist on disk.
+    installed_apps = list(settings.INSTALLED_APPS)
+
+    for app in args.startapp:
+        call_command(StartApp(), app)
+    if args.register_in is not None and args.register_in.exists():
+        register_local_apps(args.register_in, args.startapp)
+    settings.INSTALLED_APPS = installed_apps + [
+        app for app in args.startapp if app not in installed_apps
+    ]
+
+    if args.makemigrations or args.migrate:
+        django.setup()
+    if args.makemigrations:
+        call_command("makemigrations", *args.startapp)
+    if args.migrate:
+        call_command("migrate")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """Project-wide infrastructure shared by the domain apps."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
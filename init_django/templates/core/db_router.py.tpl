@@ -0,0 +1,145 @@
+"""Route reads to the read replicas and everything else to the primary.
+
+Replicas are the ``DATABASES`` aliases listed in ``settings.DATABASE_REPLICAS``
+(built from ``DATABASE_REPLICA_URLS`` in ``config/settings/base.py``). With no
+replica configured every query goes to ``default``.
+
+* Reads are spread over the replicas round-robin.
+* Writes, and reads issued with ``select_for_update()``, go to the primary.
+* Inside an explicit ``transaction.atomic()`` block every read goes to the
+  primary, so a read-modify-write never reads stale replica data.
+* The transaction ``ATOMIC_REQUESTS`` wraps around each view is treated the
+  same way for POST, PUT, PATCH and DELETE requests: their reads go to the
+  primary from the start. Safe requests (GET, HEAD, OPTIONS) are expected to
+  be read-only, so their reads hit the replicas until the transaction's first
+  write, and stay on the primary after it.
+* After a write, reads stick to the primary for
+  ``DATABASE_REPLICA_STICKY_SECONDS`` to hide replication lag. The window
+  covers the rest of the request (or task) and, through a cookie set by
+  :class:`ReplicaPinMiddleware`, the client's following requests.
+"""
+
+import itertools
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_COOKIE = "replica_pin"
+# Requests whose ATOMIC_REQUESTS transaction may read from replicas
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+# Monotonic time until which reads stay on the primary
+_pinned_until: ContextVar[float] = ContextVar("replica_pinned_until", default=0.0)
+# Whether the current transaction on the primary has written
+_transaction_wrote: ContextVar[bool] = ContextVar(
+    "replica_transaction_wrote", default=False
+)
+# Whether the current view is a safe request running in the transaction opened
+# by ATOMIC_REQUESTS, whose reads use replicas until it writes
+_safe_atomic_request: ContextVar[bool] = ContextVar(
+    "replica_safe_atomic_request", default=False
+)
+
+
+def get_replicas() -> List[str]:
+    return getattr(settings, "DATABASE_REPLICAS", [])
+
+
+def get_sticky_seconds() -> float:
+    return getattr(settings, "DATABASE_REPLICA_STICKY_SECONDS", 0)
+
+
+def pin_primary(seconds: Optional[float] = None) -> None:
+    """Send reads to the primary for ``seconds`` (default: the sticky window)."""
+
+    if seconds is None:
+        seconds = get_sticky_seconds()
+    _pinned_until.set(max(_pinned_until.get(), time.monotonic() + seconds))
+
+
+def unpin() -> None:
+    """Forget earlier writes, e.g. at the start of a request."""
+
+    _pinned_until.set(0.0)
+    _transaction_wrote.set(False)
+    _safe_atomic_request.set(False)
+
+
+def is_pinned() -> bool:
+    return time.monotonic() < _pinned_until.get()
+
+
+class ReplicaRouter:
+    """Database router implementing the policy described in the module docstring."""
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def db_for_read(self, model, **hints) -> str:
+        replicas = get_replicas()
+        if not replicas or is_pinned() or self._in_primary_transaction():
+            return DEFAULT_DB_ALIAS
+        return replicas[next(self._counter) % len(replicas)]
+
+    def db_for_write(self, model, **hints) -> str:
+        if get_replicas():
+            pin_primary()
+            if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+                _transaction_wrote.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        # Replicas hold the same data as the primary
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def _in_primary_transaction(self) -> bool:
+        connection = connections[DEFAULT_DB_ALIAS]
+        if not connection.in_atomic_block:
+            _transaction_wrote.set(False)  # any earlier transaction has ended
+            return False
+        # Only the outermost ATOMIC_REQUESTS transaction of a safe request
+        # reads from replicas until it writes; any other atomic block never does
+        if connection.savepoint_ids or not _safe_atomic_request.get():
+            return True
+        return _transaction_wrote.get()
+
+
+class ReplicaPinMiddleware:
+    """Keep a client's reads on the primary for the sticky window after it writes.
+
+    Requests that write set a short-lived cookie; requests carrying it read
+    from the primary until it expires, so a redirect after a POST never shows
+    stale data.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        unpin()
+        sticky = get_sticky_seconds()
+        if not get_replicas() or not sticky:
+            return self.get_response(request)
+        if PIN_COOKIE in request.COOKIES:
+            pin_primary()
+        pinned_until = _pinned_until.get()
+        response = self.get_response(request)
+        if _pinned_until.get() > pinned_until:  # the request wrote
+            response.set_cookie(PIN_COOKIE, "1", max_age=max(round(sticky), 1))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Mirrors the check Django makes before wrapping the view in atomic()
+        non_atomic = getattr(view_func, "_non_atomic_requests", set())
+        atomic = (
+            connections[DEFAULT_DB_ALIAS].settings_dict["ATOMIC_REQUESTS"]
+            and DEFAULT_DB_ALIAS not in non_atomic
+        )
+        _safe_atomic_request.set(atomic and request.method in SAFE_METHODS)
+        return None
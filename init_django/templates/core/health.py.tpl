@@ -0,0 +1,174 @@
+"""Liveness and readiness probes answered in front of Django.
+
+Load balancers probe several times a second. Routed through Django, every
+probe would pay for the whole middleware stack (sessions, CSRF, auth,
+messages) and a transaction. ``config/wsgi.py`` and ``config/asgi.py`` wrap
+the Django application with :class:`HealthCheckWSGI` / :class:`HealthCheckASGI`,
+which answer the probe paths directly and pass everything else through:
+
+* ``/healthz`` (liveness): the process is up and serving; no I/O.
+* ``/readyz`` (readiness): the database and cache answer. Results are cached
+  for ``CACHE_SECONDS`` and each round of checks is bounded by ``TIMEOUT``, so
+  a slow dependency turns into a quick 503 instead of piling up probes.
+
+Configure paths and timings with ``HEALTH_CHECKS`` in
+``config/settings/base.py``; ``python manage.py benchmark_probes`` measures
+what a probe costs.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+
+DEFAULTS: Dict[str, Any] = {
+    "LIVE_PATH": "/healthz",
+    "READY_PATH": "/readyz",
+    "CACHE_SECONDS": 2.0,
+    "TIMEOUT": 1.0,
+    "DATABASES": ["default"],
+    "CACHES": ["default"],
+}
+
+Response = Tuple[int, bytes]
+
+
+def get_config() -> Dict[str, Any]:
+    """Return ``settings.HEALTH_CHECKS`` merged over the defaults."""
+
+    return {**DEFAULTS, **getattr(settings, "HEALTH_CHECKS", {})}
+
+
+def check_database(alias: str) -> None:
+    connection = connections[alias]
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+    except Exception:
+        connection.close()  # reconnect on the next round
+        raise
+
+
+def check_cache(alias: str) -> None:
+    cache = caches[alias]
+    cache.set("health:readyz", "ok", 30)
+    if cache.get("health:readyz") != "ok":
+        raise RuntimeError("value written to the cache could not be read back")
+
+
+def run_checks(config: Dict[str, Any]) -> Dict[str, str]:
+    """Run every readiness check and map each one to ``"ok"`` or an error."""
+
+    checks = [("database", check_database, alias) for alias in config["DATABASES"]]
+    checks += [("cache", check_cache, alias) for alias in config["CACHES"]]
+    results = {}
+    for kind, check, alias in checks:
+        try:
+            check(alias)
+            results[f"{kind}:{alias}"] = "ok"
+        except Exception as exc:
+            results[f"{kind}:{alias}"] = f"error: {exc.__class__.__name__}: {exc}"
+    return results
+
+
+class ReadinessChecker:
+    """Run readiness checks at most once per ``CACHE_SECONDS``.
+
+    Checks run on a single background thread, which keeps its own database
+    connection open between rounds. Concurrent probes share the round in
+    flight rather than starting new ones, and give up after ``TIMEOUT``.
+    """
+
+    def __init__(self) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="readyz")
+        self.lock = threading.Lock()
+        self.future = None
+        self.result: Optional[Dict[str, str]] = None
+        self.checked_at = float("-inf")
+
+    def check(self) -> Dict[str, str]:
+        config = get_config()
+        with self.lock:
+            if time.monotonic() - self.checked_at < config["CACHE_SECONDS"]:
+                return self.result
+            if self.future is None or self.future.done():
+                self.future = self.executor.submit(run_checks, config)
+            future = self.future
+        try:
+            result = future.result(timeout=config["TIMEOUT"])
+        except FutureTimeout:
+            result = {"checks": f"error: no answer within {config['TIMEOUT']}s"}
+        with self.lock:
+            self.result, self.checked_at = result, time.monotonic()
+        return result
+
+    def response(self) -> Response:
+        results = self.check()
+        ready = all(value == "ok" for value in results.values())
+        body = {"status": "ok" if ready else "unavailable", "checks": results}
+        return (200 if ready else 503), json.dumps(body).encode()
+
+
+readiness = ReadinessChecker()
+
+LIVE: Response = (200, b'{"status": "ok"}')
+STATUS_TEXT = {200: "200 OK", 503: "503 Service Unavailable"}
+HEADERS: List[Tuple[str, str]] = [
+    ("Content-Type", "application/json"),
+    ("Cache-Control", "no-store"),
+]
+
+
+class HealthCheckWSGI:
+    """WSGI wrapper answering the probe paths before Django sees the request."""
+
+    def __init__(self, application) -> None:
+        self.application = application
+        config = get_config()
+        self.live_path, self.ready_path = config["LIVE_PATH"], config["READY_PATH"]
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO")
+        if path == self.live_path:
+            status, body = LIVE
+        elif path == self.ready_path:
+            status, body = readiness.response()
+        else:
+            return self.application(environ, start_response)
+        start_response(
+            STATUS_TEXT[status], HEADERS + [("Content-Length", str(len(body)))]
+        )
+        return [body]
+
+
+class HealthCheckASGI:
+    """ASGI counterpart of :class:`HealthCheckWSGI`."""
+
+    def __init__(self, application) -> None:
+        self.application = application
+        config = get_config()
+        self.live_path, self.ready_path = config["LIVE_PATH"], config["READY_PATH"]
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path") if scope["type"] == "http" else None
+        if path == self.live_path:
+            status, body = LIVE
+        elif path == self.ready_path:
+            # The checker blocks on I/O; keep it off the event loop
+            status, body = await asyncio.to_thread(readiness.response)
+        else:
+            return await self.application(scope, receive, send)
+        headers = [(k.lower().encode(), v.encode()) for k, v in HEADERS]
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,96 @@
+"""Measure what a health probe costs, with and without the ``core.health`` wrapper.
+
+Usage::
+
+    python manage.py benchmark_probes
+    python manage.py benchmark_probes --requests 5000
+
+Probes are sent in-process to the WSGI application from ``WSGI_APPLICATION``,
+so the numbers show the per-request CPU cost without network overhead. The
+last row sends the same probe straight to Django, through the full middleware
+stack, for comparison.
+"""
+
+import logging
+import time
+from io import BytesIO
+from typing import Callable, Tuple
+from wsgiref.util import setup_testing_defaults
+
+from django.core.management.base import BaseCommand
+from django.core.servers.basehttp import get_internal_wsgi_application
+from django.test import override_settings
+
+from core.health import HealthCheckWSGI, get_config, readiness
+
+
+def probe(application: Callable, path: str) -> str:
+    """Send one GET request for ``path`` to ``application``; return the status."""
+
+    environ = {"PATH_INFO": path, "wsgi.input": BytesIO()}
+    setup_testing_defaults(environ)
+    status = []
+    body = application(
+        environ, lambda code, headers, exc_info=None: status.append(code)
+    )
+    try:
+        b"".join(body)
+    finally:
+        if hasattr(body, "close"):
+            body.close()
+    return status[0]
+
+
+class Command(BaseCommand):
+    help = "Benchmark liveness/readiness probes against a full Django request."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=2000, help="Probes sent per scenario."
+        )
+
+    def handle(self, *args, **options):
+        application = get_internal_wsgi_application()
+        if not isinstance(application, HealthCheckWSGI):
+            application = HealthCheckWSGI(application)
+        config = get_config()
+        live, ready = config["LIVE_PATH"], config["READY_PATH"]
+        count = options["requests"]
+
+        self.stdout.write(
+            f"{'scenario':<36}{'status':<10}{'µs/probe':>10}{'probes/s':>12}"
+        )
+        self.report("liveness (wrapper)", *self.measure(application, live, count))
+        self.report(
+            "readiness, cached (wrapper)", *self.measure(application, ready, count)
+        )
+        with override_settings(HEALTH_CHECKS={**config, "CACHE_SECONDS": 0}):
+            readiness.checked_at = float("-inf")
+            self.report(
+                "readiness, uncached (wrapper)",
+                *self.measure(application, ready, count),
+            )
+        readiness.checked_at = float("-inf")
+        self.report(
+            "same path through Django middleware",
+            *self.measure(application.application, live, count),
+        )
+
+    def measure(
+        self, application: Callable, path: str, count: int
+    ) -> Tuple[str, float]:
+        logging.disable(logging.WARNING)  # Django logs every 404
+        try:
+            status = probe(application, path)  # warm up
+            start = time.perf_counter()
+            for _ in range(count):
+                probe(application, path)
+            return status, (time.perf_counter() - start) / count
+        finally:
+            logging.disable(logging.NOTSET)
+
+    def report(self, name: str, status: str, seconds: float) -> None:
+        self.stdout.write(
+            f"{name:<36}{status.split()[0]:<10}"
+            f"{seconds * 1e6:>10.1f}{1 / seconds:>12,.0f}"
+        )
@@ -0,0 +1,231 @@
+"""Load large JSON Lines or CSV files into a model, much faster than ``loaddata``.
+
+Usage::
+
+    python manage.py bulk_load users.Customer customers.jsonl
+    python manage.py bulk_load users.Customer customers.csv.gz --batch-size 5000
+    python manage.py bulk_load users.Customer customers.csv --no-copy
+
+Each line (JSON object) or row (CSV with a header) holds field names and
+values; foreign keys use their column name (``account_id``). The file is read
+as a stream and only one batch of rows is kept in memory, so memory use does
+not depend on the file size. Rows are inserted with ``bulk_create`` in
+batches, and each ``--transaction-size`` rows are committed together. On
+PostgreSQL the rows are streamed with ``COPY`` instead.
+
+Like ``bulk_create``, the loader does not call ``save()`` or send model
+signals. Python-side field defaults are applied.
+"""
+
+import csv
+import gzip
+import io
+import json
+import time
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connections, transaction
+
+
+def open_text(path: Path) -> io.TextIOBase:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return path.open(encoding="utf-8", newline="")
+
+
+def read_jsonl(stream) -> Iterator[Dict[str, Any]]:
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise CommandError(f"Line {number}: invalid JSON ({exc})") from exc
+
+
+def read_csv(stream) -> Iterator[Dict[str, Any]]:
+    yield from csv.DictReader(stream)
+
+
+READERS = {"jsonl": read_jsonl, "csv": read_csv}
+
+BOOLEANS = {"true": True, "t": True, "yes": True, "1": True}
+BOOLEANS.update({"false": False, "f": False, "no": False, "0": False})
+
+
+class Command(BaseCommand):
+    help = "Stream a JSON Lines or CSV file into a model with bulk inserts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="Target model as app_label.ModelName.")
+        parser.add_argument("path", type=Path, help="File to load (.gz supported).")
+        parser.add_argument(
+            "--format",
+            choices=sorted(READERS),
+            help="File format; inferred from the extension by default.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per bulk_create batch.",
+        )
+        parser.add_argument(
+            "--transaction-size",
+            type=int,
+            default=50000,
+            help="Rows committed in each transaction.",
+        )
+        parser.add_argument(
+            "--no-copy",
+            action="store_false",
+            dest="copy",
+            help="Use bulk_create on PostgreSQL instead of COPY.",
+        )
+        parser.add_argument(
+            "--database", default="default", help="Database alias to load into."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            self.model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+        path = options["path"]
+        if not path.exists():
+            raise CommandError(f"{path} does not exist")
+        file_format = options["format"] or path.name.removesuffix(".gz").rsplit(".")[-1]
+        if file_format not in READERS:
+            raise CommandError(f"Cannot infer the format of {path}; use --format")
+        if options["batch_size"] < 1 or options["transaction_size"] < 1:
+            raise CommandError("--batch-size and --transaction-size must be positive")
+
+        self.connection = connections[options["database"]]
+        self.fields = [
+            field
+            for field in self.model._meta.concrete_fields
+            if not getattr(field, "generated", False)
+        ]
+        self.by_name = {}
+        for field in self.fields:
+            self.by_name[field.name] = self.by_name[field.attname] = field
+        use_copy = options["copy"] and self.supports_copy()
+        insert = self.copy_rows if use_copy else self.bulk_create_rows
+
+        loaded = 0
+        start = time.perf_counter()
+        with open_text(path) as stream:
+            rows = READERS[file_format](stream)
+            is_csv = file_format == "csv"
+            while True:
+                chunk = islice(rows, options["transaction_size"])
+                with transaction.atomic(using=self.connection.alias):
+                    count = insert(chunk, options["batch_size"], is_csv)
+                if not count:
+                    break
+                loaded += count
+                self.report(loaded, start)
+        if loaded:
+            self.reset_sequences()
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Loaded {loaded} {self.model._meta.verbose_name_plural} in "
+                f"{elapsed:.1f}s ({loaded / max(elapsed, 1e-9):,.0f} rows/s, "
+                f"{'COPY' if use_copy else 'bulk_create'})"
+            )
+        )
+
+    def supports_copy(self) -> bool:
+        if self.connection.vendor != "postgresql":
+            return False
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+        return is_psycopg3  # psycopg2 has no row-wise COPY API
+
+    def build(self, row: Dict[str, Any], from_csv: bool):
+        """Turn a parsed row into a model instance, converting CSV strings."""
+
+        values = {}
+        for key, value in row.items():
+            field = self.by_name.get(key)
+            if field is None:
+                raise CommandError(f"{self.model.__name__} has no field {key!r}")
+            if from_csv:
+                value = self.convert(field, value)
+            values[field.attname] = value
+        return self.model(**values)
+
+    def convert(self, field, value: str) -> Any:
+        # CSV has no null: an empty cell means NULL on nullable fields
+        if value == "" and field.null:
+            return None
+        if field.get_internal_type() == "BooleanField":
+            value = BOOLEANS.get(value.strip().lower(), value)
+        try:
+            return field.to_python(value)
+        except ValidationError as exc:
+            raise CommandError(f"{field.name}: {'; '.join(exc.messages)}") from exc
+
+    def bulk_create_rows(self, rows: Iterator, batch_size: int, from_csv: bool) -> int:
+        count = 0
+        while batch := [self.build(row, from_csv) for row in islice(rows, batch_size)]:
+            self.model._default_manager.using(self.connection.alias).bulk_create(
+                batch, batch_size=batch_size
+            )
+            count += len(batch)
+        return count
+
+    def copy_rows(self, rows: Iterator, batch_size: int, from_csv: bool) -> int:
+        """Stream rows through ``COPY ... FROM STDIN`` (psycopg 3)."""
+
+        instances = (self.build(row, from_csv) for row in rows)
+        first = next(instances, None)
+        if first is None:
+            return 0
+        # Skip an auto primary key the file doesn't set, so the sequence fills it
+        pk = self.model._meta.pk
+        fields = [
+            field
+            for field in self.fields
+            if field is not pk or not pk.db_returning or first.pk is not None
+        ]
+        columns = ", ".join(self.connection.ops.quote_name(f.column) for f in fields)
+        table = self.connection.ops.quote_name(self.model._meta.db_table)
+        count = 0
+        with self.connection.cursor() as cursor:
+            with cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+                for obj in chain([first], instances):
+                    copy.write_row(
+                        [
+                            field.get_db_prep_save(
+                                field.pre_save(obj, add=True), self.connection
+                            )
+                            for field in fields
+                        ]
+                    )
+                    count += 1
+        return count
+
+    def reset_sequences(self) -> None:
+        """Move auto-increment sequences past explicitly loaded primary keys."""
+
+        statements: List[str] = self.connection.ops.sequence_reset_sql(
+            no_style(), [self.model]
+        )
+        if statements:
+            with self.connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+
+    def report(self, loaded: int, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"  {loaded:>12,} rows  {loaded / max(elapsed, 1e-9):>10,.0f} rows/s"
+        )
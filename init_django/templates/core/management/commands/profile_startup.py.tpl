@@ -0,0 +1,205 @@
+"""Report how long the settings and installed apps take to import.
+
+Imports are cached once a module is loaded, so the measurement runs a fresh
+``python -X importtime`` interpreter that times the settings import and every
+app's ``AppConfig`` creation and model import during ``django.setup()``. The
+``-X importtime`` report ranks the slowest imports, and heavy third-party
+imports found at module level in project code are flagged: moving them into
+the function that needs them takes them off every worker's cold start.
+
+Usage::
+
+    python manage.py profile_startup
+    python manage.py profile_startup --limit 40 --sort self --threshold-ms 20
+"""
+
+import ast
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# Runs in the child interpreter: prints timings (in ms) as JSON on stdout
+PROBE = """
+import json, time
+from django.apps.config import AppConfig
+from django.conf import settings
+
+apps_ms = {}
+create = AppConfig.create.__func__
+import_models = AppConfig.import_models
+
+
+def timed_create(cls, entry):
+    start = time.perf_counter()
+    config = create(cls, entry)
+    apps_ms[config.name] = (time.perf_counter() - start) * 1000
+    return config
+
+
+def timed_import_models(self):
+    start = time.perf_counter()
+    import_models(self)
+    apps_ms[self.name] += (time.perf_counter() - start) * 1000
+
+
+AppConfig.create = classmethod(timed_create)
+AppConfig.import_models = timed_import_models
+
+start = time.perf_counter()
+settings.INSTALLED_APPS
+settings_ms = (time.perf_counter() - start) * 1000
+
+import django
+
+start = time.perf_counter()
+django.setup()
+setup_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"settings": settings_ms, "setup": setup_ms, "apps": apps_ms}))
+"""
+
+SKIPPED_DIRS = {"migrations", "node_modules", "staticfiles", "__pycache__"}
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse the ``-X importtime`` report written to stderr.
+
+    Modules loaded through ``importlib.import_module`` (settings, app modules)
+    do not appear in this report; ``PROBE`` times those directly.
+    """
+
+    records: List[ImportRecord] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header line
+        records.append(ImportRecord(module.strip(), int(self_us), int(cumulative_us)))
+    return records
+
+
+class Command(BaseCommand):
+    help = "Report settings and app import time, and flag heavy module-level imports."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=20, help="Number of slowest imports to list."
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Rank imports by cumulative time (with children) or self time.",
+        )
+        parser.add_argument(
+            "--threshold-ms",
+            type=float,
+            default=20.0,
+            help="Flag module-level third-party imports slower than this.",
+        )
+
+    def handle(self, *args, **options):
+        timings, records = self.measure()
+        self.stdout.write(
+            f"Settings ({settings.SETTINGS_MODULE}): {timings['settings']:.1f} ms"
+        )
+        self.stdout.write(f"django.setup(): {timings['setup']:.1f} ms")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Installed apps:"))
+        for name, elapsed in sorted(
+            timings["apps"].items(), key=lambda item: item[1], reverse=True
+        ):
+            self.stdout.write(f"  {elapsed:8.1f} ms  {name}")
+
+        key = "cumulative_us" if options["sort"] == "cumulative" else "self_us"
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(f"Slowest imports ({options['sort']}):")
+        )
+        ranked = sorted(records, key=lambda r: getattr(r, key), reverse=True)
+        for record in ranked[: options["limit"]]:
+            self.stdout.write(
+                f"  {getattr(record, key) / 1000:8.1f} ms  {record.module}"
+            )
+
+        cost = {record.module: record.cumulative_us / 1000 for record in records}
+        heavy = [
+            (cost[module], location, module)
+            for location, module in self.module_level_imports()
+            if module in cost and cost[module] >= options["threshold_ms"]
+        ]
+        if heavy:
+            self.stdout.write(
+                self.style.WARNING("Heavy module-level imports in project code:")
+            )
+            for elapsed, location, module in sorted(heavy, reverse=True):
+                self.stdout.write(
+                    f"  {location} imports {module} ({elapsed:.1f} ms); consider "
+                    "importing it inside the function that uses it"
+                )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS("No heavy module-level imports found.")
+            )
+
+    def measure(self) -> Tuple[Dict, List[ImportRecord]]:
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", PROBE],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode:
+            raise CommandError(f"django.setup() failed:\n{completed.stderr[-2000:]}")
+        timings = json.loads(completed.stdout.strip().splitlines()[-1])
+        return timings, parse_importtime(completed.stderr)
+
+    def module_level_imports(self) -> Iterator[Tuple[str, str]]:
+        """Yield ``(file:line, module)`` for third-party module-level imports.
+
+        Standard library, Django and project modules are skipped: they are
+        either cheap or already paid for by ``django.setup()``.
+        """
+
+        base = Path(settings.BASE_DIR)
+        project = {path.parent.name for path in base.glob("*/__init__.py")} | {
+            path.stem for path in base.glob("*.py")
+        }
+        skipped = set(sys.stdlib_module_names) | project | {"django"}
+        for path in base.rglob("*.py"):
+            rel = path.relative_to(base)
+            if any(part.startswith(".") or part in SKIPPED_DIRS for part in rel.parts):
+                continue
+            try:
+                tree = ast.parse(path.read_text(), str(path))
+            except (SyntaxError, UnicodeDecodeError):
+                continue
+            for node in tree.body:
+                if isinstance(node, ast.Import):
+                    modules = [alias.name for alias in node.names]
+                elif (
+                    isinstance(node, ast.ImportFrom) and node.module and not node.level
+                ):
+                    modules = [node.module]
+                else:
+                    continue
+                for module in modules:
+                    if module.split(".", 1)[0] not in skipped:
+                        yield f"{rel}:{node.lineno}", module
@@ -0,0 +1,170 @@
+"""Per-request timing: total, database and cache time.
+
+:class:`RequestTimingMiddleware` measures every request and reports the
+breakdown in a ``Server-Timing`` header, which browsers show in their network
+panel::
+
+    Server-Timing: total;dur=48.2, db;dur=31.0;desc="12 queries",
+                   cache;dur=1.3;desc="4 calls", app;dur=15.9
+
+Requests slower than ``REQUEST_TIMING["SLOW_MS"]`` are sampled (at
+``SAMPLE_RATE``) to the ``core.request_timing`` logger as one structured
+record, formatted as JSON by :class:`core.logs.JsonFormatter` in production.
+Configure it with ``REQUEST_TIMING`` in ``config/settings/base.py``.
+"""
+
+import logging
+import random
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+
+logger = logging.getLogger("core.request_timing")
+
+DEFAULTS: Dict[str, Any] = {
+    "SERVER_TIMING": True,
+    "SLOW_MS": 500,
+    "SAMPLE_RATE": 1.0,
+}
+
+CACHE_METHODS = (
+    "add",
+    "get",
+    "set",
+    "touch",
+    "delete",
+    "get_many",
+    "get_or_set",
+    "has_key",
+    "incr",
+    "decr",
+    "set_many",
+    "delete_many",
+    "clear",
+)
+
+# Timings of the request being handled, None outside requests
+_current: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "request_timing", default=None
+)
+# Set while a timed cache call runs, so calls it makes internally (get_or_set
+# calling get and add) are not counted twice
+_in_cache: ContextVar[bool] = ContextVar("request_timing_in_cache", default=False)
+
+
+def get_config() -> Dict[str, Any]:
+    """Return ``settings.REQUEST_TIMING`` merged over the defaults."""
+
+    return {**DEFAULTS, **getattr(settings, "REQUEST_TIMING", {})}
+
+
+def _add(timings: Dict[str, float], kind: str, start: float) -> None:
+    timings[f"{kind}_ms"] += (time.perf_counter() - start) * 1000
+    timings[f"{kind}_calls"] += 1
+
+
+def _time_query(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        _add(timings, "db", start)
+
+
+def _timed_cache_method(method):
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        timings = _current.get()
+        if timings is None or _in_cache.get():
+            return method(*args, **kwargs)
+        token = _in_cache.set(True)
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _add(timings, "cache", start)
+            _in_cache.reset(token)
+
+    wrapper.request_timing = True
+    return wrapper
+
+
+def instrument_caches() -> None:
+    """Time calls to the backend classes of the configured caches.
+
+    Django has no cache hook comparable to ``execute_wrapper``, so the public
+    methods of each backend class are wrapped once. Outside requests the
+    wrappers only cost a context variable lookup.
+    """
+
+    for alias in settings.CACHES:
+        backend = type(caches[alias])
+        for name in CACHE_METHODS:
+            method = getattr(backend, name, None)
+            if method is not None and not getattr(method, "request_timing", False):
+                setattr(backend, name, _timed_cache_method(method))
+
+
+class RequestTimingMiddleware:
+    """Measure each request and expose the breakdown; see the module docstring."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        instrument_caches()
+
+    def __call__(self, request):
+        config = get_config()
+        timings = {"db_ms": 0.0, "db_calls": 0, "cache_ms": 0.0, "cache_calls": 0}
+        token = _current.set(timings)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_time_query))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total_ms = (time.perf_counter() - start) * 1000
+
+        if config["SERVER_TIMING"]:
+            response["Server-Timing"] = self.server_timing(total_ms, timings)
+        if total_ms >= config["SLOW_MS"] and random.random() < config["SAMPLE_RATE"]:
+            logger.warning(
+                "Slow request %s %s (%.0f ms)",
+                request.method,
+                request.path,
+                total_ms,
+                extra={
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "total_ms": round(total_ms, 1),
+                    "db_ms": round(timings["db_ms"], 1),
+                    "db_queries": timings["db_calls"],
+                    "cache_ms": round(timings["cache_ms"], 1),
+                    "cache_calls": timings["cache_calls"],
+                },
+            )
+        return response
+
+    @staticmethod
+    def server_timing(total_ms: float, timings: Dict[str, float]) -> str:
+        app_ms = max(total_ms - timings["db_ms"] - timings["cache_ms"], 0.0)
+        return ", ".join(
+            [
+                f"total;dur={total_ms:.1f}",
+                f'db;dur={timings["db_ms"]:.1f};desc="{timings["db_calls"]} queries"',
+                f'cache;dur={timings["cache_ms"]:.1f};'
+                f'desc="{timings["cache_calls"]} calls"',
+                f"app;dur={app_ms:.1f}",
+            ]
+        )
@@ -0,0 +1,50 @@
+import gzip
+import json
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.core.management import CommandError, call_command
+
+
+@pytest.mark.django_db
+def test_loads_json_lines_in_batches(tmp_path, capsys):
+    path = tmp_path / "groups.jsonl.gz"
+    with gzip.open(path, "wt") as stream:
+        for number in range(25):
+            stream.write(json.dumps({"name": f"group-{number}"}) + "\n")
+
+    call_command(
+        "bulk_load", "auth.Group", str(path), "--batch-size=4", "--transaction-size=10"
+    )
+
+    assert Group.objects.count() == 25
+    output = capsys.readouterr().out
+    assert "Loaded 25 groups" in output
+    assert "rows/s" in output
+
+
+@pytest.mark.django_db
+def test_loads_csv_converting_values(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "username,email,is_staff,last_login\n"
+        "ana,ana@example.com,true,2024-01-02T03:04:05+00:00\n"
+        "bruno,,false,\n"
+    )
+
+    call_command("bulk_load", "auth.User", str(path))
+
+    ana, bruno = User.objects.order_by("username")
+    assert ana.is_staff and ana.last_login.year == 2024
+    assert not bruno.is_staff and bruno.last_login is None
+    assert bruno.date_joined is not None  # Python-side default applied
+
+
+@pytest.mark.django_db
+def test_rejects_unknown_fields(tmp_path):
+    path = tmp_path / "groups.jsonl"
+    path.write_text('{"title": "admins"}\n')
+
+    with pytest.raises(CommandError, match="no field 'title'"):
+        call_command("bulk_load", "auth.Group", str(path))
+    assert not Group.objects.exists()
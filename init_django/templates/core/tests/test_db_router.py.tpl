@@ -0,0 +1,117 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import router, transaction
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from django.urls import path
+
+from core import db_router
+
+DATABASES = ["default", "replica1", "replica2"]
+
+# replica1/replica2 are separate SQLite databases (see config/settings/test.py),
+# so a row created on one of them shows where each read was routed.
+replicas = override_settings(
+    DATABASE_REPLICAS=["replica1", "replica2"], DATABASE_REPLICA_STICKY_SECONDS=60
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_pinning():
+    db_router.unpin()
+    yield
+    db_router.unpin()
+
+
+def on_replica1():
+    return User.objects.filter(username="replica1-only").exists()
+
+
+@replicas
+@pytest.mark.django_db(databases=DATABASES, transaction=True)
+def test_reads_are_spread_round_robin():
+    User.objects.using("replica1").create(username="replica1-only")
+
+    seen = [on_replica1() for _ in range(4)]
+
+    assert sorted(seen[:2]) == [False, True]
+    assert seen[2:] == seen[:2]
+
+
+@replicas
+@pytest.mark.django_db(databases=DATABASES, transaction=True)
+def test_reads_stick_to_primary_after_write():
+    User.objects.create(username="primary")
+
+    assert router.db_for_read(User) == "default"
+    assert all(User.objects.filter(username="primary").exists() for _ in range(3))
+
+
+@replicas
+@override_settings(DATABASE_REPLICA_STICKY_SECONDS=0)
+@pytest.mark.django_db(databases=DATABASES, transaction=True)
+def test_transaction_reads_its_writes_on_primary():
+    User.objects.create(username="outside")
+    assert router.db_for_read(User) in {"replica1", "replica2"}
+
+    with transaction.atomic():
+        assert router.db_for_read(User) == "default"  # before any write
+        User.objects.create(username="inside")
+        assert User.objects.filter(username="inside").exists()
+
+    assert router.db_for_read(User) in {"replica1", "replica2"}
+
+
+def atomic_request_view(request):
+    # ATOMIC_REQUESTS (inherited by the test settings) wraps this view
+    routed = [router.db_for_read(User)]
+    with transaction.atomic():
+        routed.append(router.db_for_read(User))
+    router.db_for_write(User)
+    routed.append(router.db_for_read(User))
+    return HttpResponse(" ".join(routed))
+
+
+urlpatterns = [path("atomic-request/", atomic_request_view)]
+
+
+@replicas
+@override_settings(DATABASE_REPLICA_STICKY_SECONDS=0, ROOT_URLCONF=__name__)
+@pytest.mark.django_db(databases=DATABASES, transaction=True)
+def test_get_request_transaction_reads_replicas_until_it_writes():
+    before, nested, after = Client().get("/atomic-request/").content.split()
+
+    assert before in {b"replica1", b"replica2"}
+    assert nested == b"default"
+    assert after == b"default"
+
+
+@replicas
+@override_settings(DATABASE_REPLICA_STICKY_SECONDS=0, ROOT_URLCONF=__name__)
+@pytest.mark.django_db(databases=DATABASES, transaction=True)
+def test_post_request_transaction_reads_primary_from_the_start():
+    routed = Client().post("/atomic-request/").content.split()
+
+    assert routed == [b"default", b"default", b"default"]
+
+
+@replicas
+def test_middleware_pins_client_after_write():
+    def write_view(request):
+        router.db_for_write(User)
+        return HttpResponse()
+
+    def read_view(request):
+        return HttpResponse(router.db_for_read(User))
+
+    factory = RequestFactory()
+    response = db_router.ReplicaPinMiddleware(write_view)(factory.post("/"))
+    assert response.cookies[db_router.PIN_COOKIE]["max-age"] == 60
+
+    request = factory.get("/")
+    request.COOKIES[db_router.PIN_COOKIE] = "1"
+    response = db_router.ReplicaPinMiddleware(read_view)(request)
+    assert response.content == b"default"
+
+    response = db_router.ReplicaPinMiddleware(read_view)(factory.get("/"))
+    assert response.content != b"default"
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from django.test import override_settings
+
+from core import health
+
+
+def django_app(environ, start_response):
+    start_response("418 I'm a teapot", [])
+    return [b"django"]
+
+
+def call(path, app=django_app):
+    environ = {"PATH_INFO": path, "REQUEST_METHOD": "GET"}
+    status = []
+    body = b"".join(
+        health.HealthCheckWSGI(app)(
+            environ, lambda code, headers, exc_info=None: status.append(code)
+        )
+    )
+    return status[0], body
+
+
+@pytest.fixture
+def checker(monkeypatch):
+    checker = health.ReadinessChecker()
+    monkeypatch.setattr(health, "readiness", checker)
+    return checker
+
+
+def test_liveness_skips_django():
+    status, body = call("/healthz")
+
+    assert status == "200 OK"
+    assert json.loads(body) == {"status": "ok"}
+
+
+def test_other_paths_reach_django():
+    assert call("/") == ("418 I'm a teapot", b"django")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_readiness_checks_database_and_cache(checker):
+    status, body = call("/readyz")
+
+    assert status == "200 OK"
+    checks = json.loads(body)["checks"]
+    assert checks == {"database:default": "ok", "cache:default": "ok"}
+
+
+def test_failing_check_returns_503(checker, monkeypatch):
+    def broken(alias):
+        raise ConnectionError("refused")
+
+    monkeypatch.setattr(health, "check_database", broken)
+    monkeypatch.setattr(health, "check_cache", broken)
+
+    status, body = call("/readyz")
+
+    assert status == "503 Service Unavailable"
+    checks = json.loads(body)["checks"]
+    assert checks["database:default"] == "error: ConnectionError: refused"
+
+
+def test_results_are_cached(checker, monkeypatch):
+    calls = []
+    monkeypatch.setattr(health, "run_checks", lambda config: calls.append(1) or {})
+
+    for _ in range(5):
+        checker.check()
+    assert len(calls) == 1
+
+    with override_settings(HEALTH_CHECKS={"CACHE_SECONDS": 0}):
+        checker.check()
+    assert len(calls) == 2
+
+
+def test_slow_checks_time_out(checker, monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(health, "run_checks", lambda config: release.wait())
+
+    with override_settings(HEALTH_CHECKS={"TIMEOUT": 0.05}):
+        status, body = checker.response()
+    release.set()
+
+    assert status == 503
+    assert "no answer within 0.05s" in json.loads(body)["checks"]["checks"]
+
+
+def test_asgi_liveness():
+    sent = []
+
+    async def django_asgi(scope, receive, send):
+        raise AssertionError("probe reached Django")
+
+    async def send(message):
+        sent.append(message)
+
+    app = health.HealthCheckASGI(django_asgi)
+    asyncio.run(app({"type": "http", "path": "/healthz"}, None, send))
+
+    assert sent[0]["status"] == 200
+    assert sent[1]["body"] == b'{"status": "ok"}'
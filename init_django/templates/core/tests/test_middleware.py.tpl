@@ -0,0 +1,64 @@
+import json
+import logging
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from core.logs import JsonFormatter
+from core.middleware import RequestTimingMiddleware
+
+
+def view(request):
+    User.objects.count()
+    cache.get_or_set("key", "value")
+    cache.get("key")
+    return HttpResponse()
+
+
+@pytest.mark.django_db
+def test_server_timing_header_reports_db_and_cache():
+    response = RequestTimingMiddleware(view)(RequestFactory().get("/"))
+
+    header = response["Server-Timing"]
+    assert header.startswith("total;dur=")
+    assert 'desc="1 queries"' in header
+    assert 'desc="2 calls"' in header
+    assert "app;dur=" in header
+
+
+@pytest.mark.django_db
+@override_settings(REQUEST_TIMING={"SLOW_MS": 0, "SERVER_TIMING": False})
+def test_slow_request_is_logged(caplog):
+    with caplog.at_level(logging.WARNING, logger="core.request_timing"):
+        response = RequestTimingMiddleware(view)(RequestFactory().get("/slow/"))
+
+    assert "Server-Timing" not in response
+    (record,) = caplog.records
+    assert record.path == "/slow/"
+    assert record.db_queries == 1
+    assert record.cache_calls == 2
+
+
+@override_settings(REQUEST_TIMING={"SLOW_MS": 0, "SAMPLE_RATE": 0})
+def test_slow_request_sampling(caplog):
+    middleware = RequestTimingMiddleware(lambda request: HttpResponse())
+    with caplog.at_level(logging.WARNING, logger="core.request_timing"):
+        middleware(RequestFactory().get("/"))
+
+    assert not caplog.records
+
+
+def test_json_formatter_keeps_extra_fields():
+    record = logging.makeLogRecord(
+        {"name": "core", "levelname": "WARNING", "msg": "Slow %s", "args": ("GET",)}
+    )
+    record.total_ms = 812.5
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "Slow GET"
+    assert payload["level"] == "WARNING"
+    assert payload["total_ms"] == 812.5
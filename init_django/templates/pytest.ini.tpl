@@ -0,0 +1,10 @@
+[pytest]
+DJANGO_SETTINGS_MODULE = config.settings.test
+python_files = tests.py test_*.py *_tests.py
+# -n auto          run tests in parallel, one pytest-xdist worker per CPU
+# --reuse-db       keep the test database between runs (pass --create-db
+#                  after schema changes)
+# --no-migrations  create test tables from models instead of replaying
+#                  every migration
+# --durations=10   report the ten slowest tests
+addopts = -n auto --reuse-db --no-migrations --durations=10
@@ -24,7 +24,7 @@ This project was generated using the Tribeca Django Init CLI, which automates th
 ## 🔧 Troubleshooting
 
 - **`manage.py` errors**: If you see a `django.core.exceptions.ImproperlyConfigured` error, ensure that your `.env` file (copied from `.env.example`) is correctly configured and sourced.
-- **Dependencies**: Make sure all dependencies from `requirements.txt` are installed in your virtual environment.
+- **Dependencies**: Install `requirements/dev.txt` for local development (runtime packages plus test and quality tools). Production installs use `requirements.txt`, which only pulls in the runtime set from `requirements/prod.txt`.
 
 ---
 
@@ -62,7 +62,18 @@ init-django
 ```
 
 - Follow the interactive prompts in your terminal
-- The CLI will guide you through each step: venv, dependencies, git, project, settings, app, migrations, and docs
+- The CLI will guide you through each step: venv, dependencies, project, settings, app, migrations, docs, and finally git
+
+### Running tests
+
+```bash
+pytest             # parallel (pytest-xdist), reuses the test database
+pytest --create-db # rebuild the test database after model changes
+pytest -n 0        # run serially, e.g. when debugging with pdb
+```
+
+`pytest.ini` selects `config.settings.test`, which uses a fast password hasher,
+the in-memory email backend and a local-memory cache.
 
 ---
 
@@ -74,9 +85,12 @@ config/
     base.py
     dev.py
     prod.py
+    test.py
 manage.py
+pytest.ini
 .venv/
-.git/
+.git/  # initialized last, with every generated file committed
+.gitignore
 README.md
 ```
 
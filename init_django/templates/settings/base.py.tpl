@@ -56,6 +56,7 @@ THIRD_PARTY_APPS = [
 
 LOCAL_APPS = [
     # Your local apps go here
+    "core",
 ]
 
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
@@ -66,7 +67,10 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
+    # First, so its timings cover the whole middleware stack
+    'core.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'core.db_router.ReplicaPinMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -114,6 +118,23 @@ DATABASES = {
 }
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
 
+# Read replicas: comma-separated database URLs in DATABASE_REPLICA_URLS become
+# the aliases replica1, replica2, ... core.db_router.ReplicaRouter sends reads
+# to them round-robin and keeps writes and transactions on "default".
+DATABASE_REPLICAS = []
+for index, url in enumerate(env.list("DATABASE_REPLICA_URLS", default=[]), start=1):
+    DATABASES[f"replica{index}"] = {
+        **env.db_url_config(url),
+        # Tests run against the primary's test database
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{index}")
+DATABASE_ROUTERS = ["core.db_router.ReplicaRouter"]
+# Seconds reads stay on the primary after a write, to hide replication lag
+DATABASE_REPLICA_STICKY_SECONDS = env.float(
+    "DATABASE_REPLICA_STICKY_SECONDS", default=2.0
+)
+
 
 # PASSWORD VALIDATION
 # ------------------------------------------------------------------------------
@@ -152,6 +173,72 @@ STORAGES = {
 }
 
 
+# LOGGING
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/topics/logging/
+# Everything goes to stderr (collected by the process manager); no file I/O on
+# the request path. SQL debug logging stays off: it formats every query.
+LOG_LEVEL = env("DJANGO_LOG_LEVEL", default="INFO")
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "plain": {"format": "%(asctime)s %(levelname)s %(name)s: %(message)s"},
+        "json": {"()": "core.logs.JsonFormatter"},
+    },
+    "filters": {
+        "require_debug_false": {"()": "django.utils.log.RequireDebugFalse"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "plain"},
+        "mail_admins": {
+            "level": "ERROR",
+            "filters": ["require_debug_false"],
+            "class": "django.utils.log.AdminEmailHandler",
+        },
+    },
+    "root": {"handlers": ["console"], "level": LOG_LEVEL},
+    "loggers": {
+        # Replaces Django's default handlers for this logger: its DEBUG-only
+        # console handler printed records root prints too, while mail_admins
+        # (server errors emailed to ADMINS when DEBUG is off) is kept
+        "django": {"handlers": ["mail_admins"], "level": LOG_LEVEL},
+        "django.db.backends": {"level": "WARNING"},
+        "core.request_timing": {"level": "INFO"},
+    },
+}
+
+
+# REQUEST TIMING
+# ------------------------------------------------------------------------------
+# Used by core.middleware.RequestTimingMiddleware
+REQUEST_TIMING = {
+    # Add a Server-Timing header (total, db, cache, app) to every response
+    "SERVER_TIMING": env.bool("REQUEST_TIMING_HEADER", default=True),
+    # Log requests slower than this to core.request_timing...
+    "SLOW_MS": env.int("REQUEST_TIMING_SLOW_MS", default=500),
+    # ...keeping this fraction of them
+    "SAMPLE_RATE": env.float("REQUEST_TIMING_SAMPLE_RATE", default=1.0),
+}
+
+
+# HEALTH CHECKS
+# ------------------------------------------------------------------------------
+# Probes answered by core.health in config/wsgi.py and asgi.py, before any
+# middleware: point load balancer liveness checks at LIVE_PATH and readiness
+# checks at READY_PATH.
+HEALTH_CHECKS = {
+    "LIVE_PATH": "/healthz",
+    "READY_PATH": "/readyz",
+    # Readiness results are reused for this long...
+    "CACHE_SECONDS": env.float("HEALTH_CHECK_CACHE_SECONDS", default=2.0),
+    # ...and a round of checks taking longer than this reports 503
+    "TIMEOUT": env.float("HEALTH_CHECK_TIMEOUT", default=1.0),
+    "DATABASES": ["default"],
+    "CACHES": ["default"],
+}
+
+
 # DEFAULT AUTO FIELD
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#default-auto-field
@@ -22,3 +22,11 @@ CSRF_COOKIE_SECURE = True
 SECURE_HSTS_SECONDS = 60
 SECURE_HSTS_INCLUDE_SUBDOMAINS = env.bool('DJANGO_SECURE_HSTS_INCLUDE_SUBDOMAINS', default=True)
 SECURE_HSTS_PRELOAD = env.bool('DJANGO_SECURE_HSTS_PRELOAD', default=True)
+
+# Logging
+# ------------------------------------------------------------------------------
+# One JSON object per line so log shippers can index the slow-request fields
+LOGGING["handlers"]["console"]["formatter"] = "json"
+LOG_LEVEL = env("DJANGO_LOG_LEVEL", default="WARNING")
+LOGGING["root"]["level"] = LOG_LEVEL
+LOGGING["loggers"]["django"]["level"] = LOG_LEVEL
@@ -0,0 +1,38 @@
+# Test-specific settings (selected by pytest.ini)
+
+from .base import *
+
+DEBUG = False
+
+# Password hashing dominates the run time of auth-heavy suites; MD5 is fast
+# and good enough for throwaway test users.
+# https://docs.djangoproject.com/en/dev/topics/testing/overview/#password-hashing
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Sent messages are kept in django.core.mail.outbox
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+# Per-process in-memory cache, no external service required
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# The manifest storage needs collectstatic to have run; tests don't need it
+STORAGES = {
+    **STORAGES,
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
+# Two local SQLite databases standing in for read replicas in
+# core/tests/test_db_router.py; nothing is routed to them unless a test sets
+# DATABASE_REPLICAS.
+DATABASES = {
+    "default": DATABASES["default"],
+    "replica1": {"ENGINE": "django.db.backends.sqlite3", "NAME": BASE_DIR / "replica1.sqlite3"},
+    "replica2": {"ENGINE": "django.db.backends.sqlite3", "NAME": BASE_DIR / "replica2.sqlite3"},
+}
+DATABASE_REPLICAS = []
@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import QueuedTask
+
+
+@admin.register(QueuedTask)
+class QueuedTaskAdmin(admin.ModelAdmin):
+    list_display = ["name", "status", "attempts", "run_after", "created_at"]
+    list_filter = ["status", "name"]
+    search_fields = ["name", "uuid", "last_error"]
+    readonly_fields = ["uuid", "created_at"]
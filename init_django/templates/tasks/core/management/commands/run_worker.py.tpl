@@ -0,0 +1,134 @@
+"""Execute queued background tasks (see ``core.tasks``).
+
+Usage::
+
+    python manage.py run_worker                     # settings.TASKS defaults
+    python manage.py run_worker --concurrency 8 --pool process
+    python manage.py run_worker --burst             # drain the queue and exit
+
+Tasks run in a thread pool by default, which suits I/O-bound work such as
+emails and webhooks. ``--pool process`` uses separate interpreters for
+CPU-bound work. SIGINT/SIGTERM stop claiming new tasks and let running ones
+finish.
+"""
+
+import multiprocessing
+import signal
+import time
+import traceback
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Dict
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core import tasks
+
+
+def init_process() -> None:
+    """Set up Django in a freshly spawned pool process."""
+
+    import django
+
+    django.setup()
+    tasks.autodiscover()
+
+
+class Command(BaseCommand):
+    help = "Run background tasks from the configured queue."
+
+    def add_arguments(self, parser):
+        config = tasks.get_config()
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=config["CONCURRENCY"],
+            help="Number of tasks executed at the same time.",
+        )
+        parser.add_argument(
+            "--pool",
+            choices=["thread", "process"],
+            default=config["POOL"],
+            help="Run tasks in threads (I/O-bound) or processes (CPU-bound).",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once the queue is empty instead of polling for new tasks.",
+        )
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        tasks.autodiscover()
+        backend = tasks.get_backend()
+        concurrency = options["concurrency"]
+        poll_interval = tasks.get_config()["POLL_INTERVAL"]
+        self.stdout.write(
+            f"Worker started: {backend.__class__.__name__}, "
+            f"{concurrency} {options['pool']}(s)"
+        )
+
+        running: Dict[Future, tasks.Job] = {}
+        with self.make_pool(options["pool"], concurrency) as pool:
+            while running or not self.stopping:
+                claimed = []
+                if not self.stopping and len(running) < concurrency:
+                    claimed = backend.claim(concurrency - len(running))
+                    close_old_connections()
+                for job in claimed:
+                    future = pool.submit(tasks.execute, job.name, job.args, job.kwargs)
+                    running[future] = job
+                if not running:
+                    if options["burst"]:
+                        break
+                    self.sleep(poll_interval)
+                    continue
+                done, _ = wait(
+                    running, timeout=poll_interval, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    self.finish(backend, running.pop(future), future)
+        self.stdout.write("Worker stopped.")
+
+    def make_pool(self, kind: str, concurrency: int) -> Executor:
+        if kind == "process":
+            # "spawn" avoids sharing the parent's database connections
+            return ProcessPoolExecutor(
+                max_workers=concurrency,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_process,
+            )
+        return ThreadPoolExecutor(max_workers=concurrency)
+
+    def finish(self, backend, job: tasks.Job, future: Future) -> None:
+        error = future.exception()
+        if error is None:
+            backend.complete(job)
+            self.stdout.write(f"Done    {job.name} [{job.id}]")
+        else:
+            message = "".join(traceback.format_exception(error))
+            backend.fail(job, message)
+            self.stderr.write(
+                f"Failed  {job.name} [{job.id}] attempt {job.attempts}: {error!r}"
+            )
+        close_old_connections()
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep, waking up early when a stop signal arrives."""
+
+        deadline = time.monotonic() + seconds
+        while not self.stopping and time.monotonic() < deadline:
+            time.sleep(min(0.1, seconds))
+
+    def stop(self, signum, frame) -> None:
+        self.stopping = True
+        self.stdout.write("Stopping after running tasks finish...")
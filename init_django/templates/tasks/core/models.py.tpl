@@ -0,0 +1,33 @@
+from django.db import models
+
+
+class QueuedTask(models.Model):
+    """A background task waiting in, or failed out of, the database queue.
+
+    Rows are written by ``core.tasks.DatabaseBackend`` and deleted once the
+    task succeeds; only queued, running and failed tasks remain.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued"
+        RUNNING = "running"
+        FAILED = "failed"
+
+    uuid = models.CharField(max_length=32, unique=True)
+    name = models.CharField(max_length=255)
+    args = models.JSONField(default=list)
+    kwargs = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=16, choices=Status.choices, default=Status.QUEUED
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_retries = models.PositiveIntegerField(default=0)
+    run_after = models.DateTimeField()
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "run_after"])]
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.status})"
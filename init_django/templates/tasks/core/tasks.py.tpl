@@ -0,0 +1,288 @@
+"""Background tasks: move slow work (emails, exports, webhooks) off the request path.
+
+Declare a task with the :func:`task` decorator and enqueue it with ``delay``::
+
+    from core.tasks import task
+
+    @task(max_retries=5)
+    def send_welcome_email(user_id):
+        ...
+
+    send_welcome_email.delay(user.pk)  # returns immediately
+    send_welcome_email.enqueue(args=(user.pk,), countdown=60)  # run in a minute
+
+Arguments must be JSON serialisable. Tasks are stored by the backend named in
+``settings.TASKS["BACKEND"]`` and executed by ``python manage.py run_worker``:
+
+* ``core.tasks.DatabaseBackend`` (default) keeps the queue in the project
+  database, so no broker is needed.
+* ``core.tasks.RedisBackend`` keeps it in Redis (``pip install redis`` and set
+  ``TASKS_BACKEND``/``TASKS_REDIS_URL``); the task API does not change.
+
+Modules named ``tasks`` in installed apps are imported by the worker, so put
+task definitions in ``<app>/tasks.py``.
+"""
+
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules, import_string
+
+DEFAULTS: Dict[str, Any] = {
+    "BACKEND": "core.tasks.DatabaseBackend",
+    "REDIS_URL": "redis://localhost:6379/0",
+    "CONCURRENCY": 4,
+    "POOL": "thread",
+    "MAX_RETRIES": 3,
+    "RETRY_BACKOFF": 5,
+    "VISIBILITY_TIMEOUT": 300,
+    "POLL_INTERVAL": 1.0,
+    "EAGER": False,
+}
+
+_registry: Dict[str, "Task"] = {}
+
+
+def get_config() -> Dict[str, Any]:
+    """Return ``settings.TASKS`` merged over the defaults."""
+
+    return {**DEFAULTS, **getattr(settings, "TASKS", {})}
+
+
+@dataclass
+class Job:
+    """A task invocation as handed from a backend to the worker."""
+
+    id: str
+    name: str
+    args: List[Any] = field(default_factory=list)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    max_retries: int = 0
+
+
+class Task:
+    """A function that can be executed in the background."""
+
+    def __init__(self, func: Callable, name: str, max_retries: Optional[int]):
+        self.func = func
+        self.name = name
+        self.max_retries = max_retries
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.func(*args, **kwargs)
+
+    def delay(self, *args: Any, **kwargs: Any) -> Optional[str]:
+        """Enqueue the task with ``args``/``kwargs`` and return its id."""
+
+        return self.enqueue(args=args, kwargs=kwargs)
+
+    def enqueue(
+        self,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        countdown: float = 0,
+    ) -> Optional[str]:
+        """Enqueue the task to run in ``countdown`` seconds.
+
+        With ``TASKS["EAGER"]`` the task runs synchronously instead, which is
+        convenient in tests; ``None`` is returned in that case.
+        """
+
+        config = get_config()
+        if config["EAGER"]:
+            self.func(*args, **(kwargs or {}))
+            return None
+        max_retries = (
+            config["MAX_RETRIES"] if self.max_retries is None else self.max_retries
+        )
+        job = Job(uuid.uuid4().hex, self.name, list(args), kwargs or {}, 0, max_retries)
+        json.dumps([job.args, job.kwargs])  # fail fast on unserialisable arguments
+        get_backend().enqueue(job, timezone.now() + timedelta(seconds=countdown))
+        return job.id
+
+
+def task(
+    func: Optional[Callable] = None,
+    *,
+    name: str = "",
+    max_retries: Optional[int] = None,
+) -> Any:
+    """Register ``func`` as a background task (usable with or without arguments)."""
+
+    def register(func: Callable) -> Task:
+        task_name = name or f"{func.__module__}.{func.__qualname__}"
+        _registry[task_name] = Task(func, task_name, max_retries)
+        return _registry[task_name]
+
+    return register(func) if func is not None else register
+
+
+def autodiscover() -> None:
+    """Import the ``tasks`` module of every installed app."""
+
+    autodiscover_modules("tasks")
+
+
+def execute(name: str, args: List[Any], kwargs: Dict[str, Any]) -> None:
+    """Run a registered task; called by the worker in a pool thread or process."""
+
+    close_old_connections()
+    try:
+        if name not in _registry:
+            autodiscover()
+        _registry[name].func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds to wait before retry number ``attempts`` (exponential backoff)."""
+
+    return get_config()["RETRY_BACKOFF"] * 2 ** max(attempts - 1, 0)
+
+
+class DatabaseBackend:
+    """Queue stored in the ``core.QueuedTask`` table; no external broker."""
+
+    def enqueue(self, job: Job, run_after) -> None:
+        from core.models import QueuedTask
+
+        QueuedTask.objects.create(
+            uuid=job.id,
+            name=job.name,
+            args=job.args,
+            kwargs=job.kwargs,
+            max_retries=job.max_retries,
+            run_after=run_after,
+        )
+
+    def claim(self, limit: int) -> List[Job]:
+        """Lock up to ``limit`` due jobs for this worker.
+
+        Claimed rows are marked running and hidden until the visibility timeout
+        expires, so jobs of a crashed worker are picked up again. Each claim is
+        a compare-and-swap on ``run_after``, which keeps concurrent workers from
+        running the same job even on databases without ``SKIP LOCKED``.
+        """
+
+        from core.models import QueuedTask
+
+        now = timezone.now()
+        hidden_until = now + timedelta(seconds=get_config()["VISIBILITY_TIMEOUT"])
+        candidates = QueuedTask.objects.filter(
+            status__in=[QueuedTask.Status.QUEUED, QueuedTask.Status.RUNNING],
+            run_after__lte=now,
+        ).order_by("run_after", "id")
+        jobs = []
+        for row in candidates[:limit]:
+            claimed = QueuedTask.objects.filter(
+                pk=row.pk, run_after=row.run_after
+            ).update(
+                status=QueuedTask.Status.RUNNING,
+                run_after=hidden_until,
+                attempts=row.attempts + 1,
+            )
+            if claimed:
+                jobs.append(
+                    Job(
+                        row.uuid,
+                        row.name,
+                        row.args,
+                        row.kwargs,
+                        row.attempts + 1,
+                        row.max_retries,
+                    )
+                )
+        return jobs
+
+    def complete(self, job: Job) -> None:
+        from core.models import QueuedTask
+
+        QueuedTask.objects.filter(uuid=job.id).delete()
+
+    def fail(self, job: Job, error: str) -> None:
+        from core.models import QueuedTask
+
+        if job.attempts <= job.max_retries:
+            run_after = timezone.now() + timedelta(seconds=retry_delay(job.attempts))
+            status = QueuedTask.Status.QUEUED
+        else:
+            run_after = timezone.now()
+            status = QueuedTask.Status.FAILED
+        QueuedTask.objects.filter(uuid=job.id).update(
+            status=status, run_after=run_after, last_error=error
+        )
+
+
+class RedisBackend:
+    """Queue stored in Redis: a list of ready jobs and a sorted set of delayed ones.
+
+    Jobs are pushed after the surrounding transaction commits. A job being
+    executed by a worker that crashes is lost (at-most-once delivery).
+    """
+
+    # Move due jobs from the delayed set to the ready list atomically
+    PROMOTE = """
+    local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 100)
+    for _, payload in ipairs(due) do
+        redis.call('ZREM', KEYS[1], payload)
+        redis.call('RPUSH', KEYS[2], payload)
+    end
+    return #due
+    """
+
+    def __init__(self, prefix: str = "tasks") -> None:
+        try:
+            import redis
+        except ImportError as exc:
+            raise ImproperlyConfigured(
+                "RedisBackend requires the 'redis' package (pip install redis)."
+            ) from exc
+        self.client = redis.Redis.from_url(get_config()["REDIS_URL"])
+        self.ready = f"{prefix}:ready"
+        self.delayed = f"{prefix}:delayed"
+        self.failed = f"{prefix}:failed"
+
+    def enqueue(self, job: Job, run_after) -> None:
+        payload = json.dumps(job.__dict__)
+        score = run_after.timestamp()
+        transaction.on_commit(lambda: self.client.zadd(self.delayed, {payload: score}))
+
+    def claim(self, limit: int) -> List[Job]:
+        self.client.eval(self.PROMOTE, 2, self.delayed, self.ready, time.time())
+        payloads = self.client.lpop(self.ready, limit) or []
+        jobs = [Job(**json.loads(payload)) for payload in payloads]
+        for job in jobs:
+            job.attempts += 1
+        return jobs
+
+    def complete(self, job: Job) -> None:
+        pass
+
+    def fail(self, job: Job, error: str) -> None:
+        if job.attempts <= job.max_retries:
+            score = time.time() + retry_delay(job.attempts)
+            self.client.zadd(self.delayed, {json.dumps(job.__dict__): score})
+        else:
+            self.client.rpush(self.failed, json.dumps({**job.__dict__, "error": error}))
+
+
+_backends: Dict[str, Any] = {}
+
+
+def get_backend() -> Any:
+    """Return the backend instance configured in ``TASKS["BACKEND"]``."""
+
+    backend_path = get_config()["BACKEND"]
+    if backend_path not in _backends:
+        _backends[backend_path] = import_string(backend_path)()
+    return _backends[backend_path]
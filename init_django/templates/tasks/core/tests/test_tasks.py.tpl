@@ -0,0 +1,62 @@
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+
+from core import tasks
+from core.models import QueuedTask
+
+calls = []
+
+
+@tasks.task(max_retries=1)
+def record(value):
+    calls.append(value)
+
+
+@tasks.task(max_retries=1)
+def explode():
+    raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_runs_queued_task():
+    record.delay("hello")
+    assert QueuedTask.objects.count() == 1
+
+    call_command("run_worker", "--burst", "--concurrency", "2")
+
+    assert calls == ["hello"]
+    assert not QueuedTask.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_task_is_retried_then_marked_failed():
+    explode.delay()
+
+    with override_settings(TASKS={"RETRY_BACKOFF": 0}):
+        call_command("run_worker", "--burst")
+
+    queued = QueuedTask.objects.get()
+    assert queued.status == QueuedTask.Status.FAILED
+    assert queued.attempts == 2
+    assert "boom" in queued.last_error
+
+
+@pytest.mark.django_db
+def test_claim_is_exclusive():
+    record.delay("once")
+    backend = tasks.DatabaseBackend()
+
+    assert len(backend.claim(10)) == 1
+    assert backend.claim(10) == []
+
+
+def test_eager_mode_runs_inline():
+    with override_settings(TASKS={"EAGER": True}):
+        assert record.delay("inline") is None
+    assert calls == ["inline"]
@@ -0,0 +1,21 @@
+
+
+# BACKGROUND TASKS
+# ------------------------------------------------------------------------------
+# Used by core.tasks and `python manage.py run_worker`. Switch BACKEND to
+# "core.tasks.RedisBackend" (and install redis) to move the queue off the database.
+TASKS = {
+    "BACKEND": env("TASKS_BACKEND", default="core.tasks.DatabaseBackend"),
+    "REDIS_URL": env("TASKS_REDIS_URL", default="redis://localhost:6379/0"),
+    # Tasks executed at the same time by one worker, in threads or processes
+    "CONCURRENCY": env.int("TASKS_CONCURRENCY", default=4),
+    "POOL": env("TASKS_POOL", default="thread"),
+    # Retries wait RETRY_BACKOFF seconds, doubled after every failed attempt
+    "MAX_RETRIES": env.int("TASKS_MAX_RETRIES", default=3),
+    "RETRY_BACKOFF": 5,
+    # Running tasks not finished after this many seconds are handed out again
+    "VISIBILITY_TIMEOUT": 300,
+    "POLL_INTERVAL": 1.0,
+    # Run tasks synchronously on delay(), e.g. in tests
+    "EAGER": env.bool("TASKS_EAGER", default=False),
+}
@@ -0,0 +1,45 @@
+"""Shared pytest configuration for the Tribeca Django Init test suite."""
+
+from pathlib import Path
+
+import pytest
+
+from init_django.command_backend import (
+    RecordingBackend,
+    ReplayBackend,
+    SubprocessBackend,
+    set_backend,
+)
+
+TRANSCRIPTS_DIR = Path(__file__).parent / "transcripts"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--commands",
+        choices=["replay", "record", "real"],
+        default="replay",
+        help=(
+            "How CLI integration tests execute shell commands: replay the "
+            "transcripts in tests/transcripts (default, offline), record new "
+            "ones, or run everything for real without recording."
+        ),
+    )
+
+
+@pytest.fixture
+def command_backend(request):
+    """Route ``cli_common.run`` through the backend chosen with ``--commands``."""
+    mode = request.config.getoption("--commands")
+    transcript = TRANSCRIPTS_DIR / f"{request.node.name}.json"
+    if mode == "record":
+        backend = RecordingBackend(transcript)
+    elif mode == "replay":
+        backend = ReplayBackend(transcript)
+    else:
+        backend = SubprocessBackend()
+    previous = set_backend(backend)
+    yield backend
+    set_backend(previous)
+    if isinstance(backend, ReplayBackend):
+        backend.assert_finished()
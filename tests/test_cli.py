@@ -2,6 +2,7 @@
 
 import json
 import os
+import re
 import shutil
 import sys
 import tempfile
@@ -15,6 +16,10 @@ from click.testing import CliRunner  # noqa: E402
 from init_django.cli_mcp import main as mcp_main  # noqa: E402
 from init_django.cli_user import main  # noqa: E402
 
+# Shell commands are replayed from tests/transcripts by default; run
+# ``pytest --commands=record`` after changing the commands a flow executes.
+pytestmark = pytest.mark.usefixtures("command_backend")
+
 
 @pytest.fixture
 def temp_project_dir():
@@ -35,14 +40,17 @@ def test_cli_basic_flow(temp_project_dir, monkeypatch):
         "1",  # Reuse or create venv
         "1",  # Install dependencies
         "",  # Django version (default)
-        "1",  # Initialize git
+        "1",  # Runtime and development dependencies
         "1",  # Create Django project
         "1",  # Create settings package
+        "1",  # Scaffold background tasks
         # Only after settings prompt is complete, send app name:
         "users",  # App name
         "1",  # Create app
         "1",  # Apply migrations
         "1",  # Create .env file
+        "1",  # Precompile bytecode
+        "1",  # Initialize git
     ]
     monkeypatch.setenv("DJANGO_SECRET_KEY", "test-key")
     result = runner.invoke(main, input="\n".join(inputs) + "\n")
@@ -52,10 +60,38 @@ def test_cli_basic_flow(temp_project_dir, monkeypatch):
         temp_project_dir / "manage.py"
     ).exists()
     assert (temp_project_dir / "README.md").exists()
+    assert (temp_project_dir / ".gitignore").exists()
+    assert not (temp_project_dir / "Python.gitignore").exists()
     assert (temp_project_dir / "config" / "settings" / "base.py").exists()
     assert (temp_project_dir / "config" / "settings" / "dev.py").exists()
     assert (temp_project_dir / "config" / "settings" / "prod.py").exists()
+    assert (temp_project_dir / "config" / "settings" / "test.py").exists()
+    assert (temp_project_dir / "pytest.ini").exists()
+    assert (
+        temp_project_dir / "core" / "management" / "commands" / "profile_startup.py"
+    ).exists()
+    assert (temp_project_dir / "core" / "db_router.py").exists()
+    assert (temp_project_dir / "core" / "middleware.py").exists()
+    assert (
+        temp_project_dir / "core" / "management" / "commands" / "bulk_load.py"
+    ).exists()
+    assert (temp_project_dir / "core" / "health.py").exists()
+    assert (
+        "HealthCheckWSGI(application)"
+        in (temp_project_dir / "config" / "wsgi.py").read_text()
+    )
+    assert (temp_project_dir / "core" / "tasks.py").exists()
+    assert (
+        temp_project_dir / "core" / "management" / "commands" / "run_worker.py"
+    ).exists()
+    assert (
+        "TASKS = {"
+        in (temp_project_dir / "config" / "settings" / "base.py").read_text()
+    )
     assert (temp_project_dir / ".env").exists()
+    # Git runs last, so the initial commit holds the generated project
+    committed = re.search(r"Committed (\d+) files", result.output)
+    assert committed and int(committed.group(1)) > 20
 
 
 def test_cli_skip_steps(temp_project_dir, monkeypatch):
@@ -65,14 +101,8 @@ def test_cli_skip_steps(temp_project_dir, monkeypatch):
     inputs = [
         "2",  # Skip venv
         "2",  # Skip dependencies
+        "2",  # Skip Django project (and with it settings, apps and .env)
         "2",  # Skip git
-        "2",  # Skip Django project
-        "2",  # Skip settings
-        # Only after settings prompt is complete, send app name:
-        "users",  # App name
-        "2",  # Skip app
-        "2",  # Skip migrations
-        "2",  # Skip .env file
     ]
     monkeypatch.setenv("DJANGO_SECRET_KEY", "test-key")
     result = runner.invoke(main, input="\n".join(inputs) + "\n")
@@ -82,21 +112,24 @@ def test_cli_skip_steps(temp_project_dir, monkeypatch):
 
 
 def test_cli_custom_app_name(temp_project_dir, monkeypatch):
-    """Check that providing a custom app name creates that app."""
+    """Check that custom app names create and register every app."""
     runner = CliRunner()
     app_name = "customapp"
     inputs = [
         "1",  # venv
         "1",  # deps
         "",  # Django version (default)
-        "1",  # git
+        "2",  # runtime dependencies only
         "1",  # django project
         "1",  # settings
+        "2",  # skip background tasks
         # Only after settings prompt is complete, send app name:
-        app_name,  # app name
-        "1",  # create app
+        f"{app_name},billing",  # app names
+        "1",  # create apps
         "1",  # migrations
         "1",  # create .env file
+        "1",  # precompile bytecode
+        "1",  # git
     ]
     monkeypatch.setenv("DJANGO_SECRET_KEY", "test-key")
     result = runner.invoke(main, input="\n".join(inputs) + "\n")
@@ -104,6 +137,16 @@ def test_cli_custom_app_name(temp_project_dir, monkeypatch):
     assert (temp_project_dir / app_name).exists() or (
         temp_project_dir / f"{app_name}"
     ).exists()
+    assert (temp_project_dir / "billing" / "apps.py").exists()
+    assert (temp_project_dir / "requirements" / "prod.txt").exists()
+    assert (
+        "-r requirements/prod.txt"
+        in (temp_project_dir / "requirements.txt").read_text()
+    )
+    base_settings = (temp_project_dir / "config" / "settings" / "base.py").read_text()
+    assert '"customapp",' in base_settings
+    assert '"billing",' in base_settings
+    assert not (temp_project_dir / "core" / "tasks.py").exists()
     assert (temp_project_dir / ".env").exists()
 
 
@@ -149,7 +192,6 @@ def test_cli_requires_dependencies_user(temp_project_dir, monkeypatch):
     inputs = [
         "1",  # create venv
         "2",  # skip dependencies
-        "2",  # skip git
         "1",  # attempt project creation
     ]
     monkeypatch.setenv("DJANGO_SECRET_KEY", "test-key")
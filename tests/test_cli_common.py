@@ -1,6 +1,9 @@
 import json
 import subprocess
 
+import click
+import pytest
+
 from init_django import cli_common
 
 
@@ -47,13 +50,173 @@ def test_create_helpers(tmp_path, monkeypatch):
     cli_common.create_virtualenv(venv)
     cli_common.install_dependencies(venv, "5.2.3")
     cli_common.start_django_project(venv, tmp_path)
-    cli_common.create_app(venv, "users")
-    cli_common.apply_migrations(venv)
+    cli_common.create_apps(venv, tmp_path, ["users", "billing"], migrate=True)
     cli_common.create_readme(tmp_path)
     cli_common.create_env_file(tmp_path)
     cli_common.create_settings_package(tmp_path)
+    cli_common.create_tasks_module(tmp_path)
+    cli_common.precompile_bytecode(venv, tmp_path)
 
     assert any("django-admin" in c for c in cmds)
+    batch = [c for c in cmds if "manage_batch.py" in c]
+    assert len(batch) == 1
+    assert "--startapp users --startapp billing" in batch[0]
+    assert "--migrate" in batch[0]
     assert (tmp_path / "README.md").exists()
     assert (tmp_path / ".env").exists()
     assert (tmp_path / "config" / "settings" / "base.py").exists()
+    assert (tmp_path / "core" / "apps.py").exists()
+    assert (tmp_path / "core" / "migrations" / "0001_initial.py").exists()
+    assert "TASKS = {" in (tmp_path / "config" / "settings" / "base.py").read_text()
+    assert any("-m compileall" in c for c in cmds)
+
+
+def test_staged_project_commits_files(tmp_path):
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "wsgi.py").write_text("old")
+
+    with cli_common.staged_project(tmp_path) as stage:
+        stage.write("config/wsgi.py", "new")
+        stage.write("config/settings/base.py", "DEBUG = False")
+
+    assert (tmp_path / "config" / "wsgi.py").read_text() == "new"
+    assert (tmp_path / "config" / "settings" / "base.py").exists()
+    assert not list(tmp_path.glob(".init-django-stage-*"))
+
+
+def test_staged_project_rolls_back_on_error(tmp_path):
+    with pytest.raises(RuntimeError):
+        with cli_common.staged_project(tmp_path) as stage:
+            stage.write("README.md", "partial")
+            raise RuntimeError("boom")
+
+    assert not (tmp_path / "README.md").exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_dependency_prefetcher_retargets(tmp_path, monkeypatch):
+    started = []
+
+    class DummyPopen:
+        def __init__(self, args, **kwargs):
+            started.append(args)
+            self.terminated = False
+
+        def poll(self):
+            return None
+
+        def terminate(self):
+            self.terminated = True
+
+        def wait(self, timeout=None):
+            return 0
+
+    monkeypatch.delenv("INIT_DJANGO_NO_PREFETCH", raising=False)
+    monkeypatch.setattr(subprocess, "Popen", DummyPopen)
+    prefetcher = cli_common.DependencyPrefetcher(tmp_path / "wheels")
+    prefetcher.start()
+    assert prefetcher.result(cli_common.DEFAULT_DJANGO_VERSION) == tmp_path / "wheels"
+    assert prefetcher.result("4.2") == tmp_path / "wheels"
+    assert len(started) == 2
+    assert "django~=4.2" in started[1]
+
+    prefetcher.start("4.2", dev=False)
+    assert "black" not in started[2] and "gunicorn" in started[2]
+    assert prefetcher.result("4.2", dev=True) == tmp_path / "wheels"
+    assert "black" in started[3]
+
+
+def test_parse_app_names():
+    assert cli_common.parse_app_names("users, billing users,,orders") == [
+        "users",
+        "billing",
+        "orders",
+    ]
+
+
+def test_dependency_sets_split_runtime_and_dev():
+    sets = cli_common.dependency_sets("4.2")
+
+    assert sets["runtime"][0] == "django~=4.2"
+    assert "gunicorn" in sets["runtime"]
+    assert "black" in sets["dev"] and "black" not in sets["runtime"]
+    assert "pre-commit" not in cli_common.dependency_specs("4.2", dev=False)
+
+
+def test_install_dependencies_reports_each_set(tmp_path, monkeypatch):
+    cmds = []
+    site_packages = tmp_path / "lib" / "python3.12" / "site-packages"
+
+    def fake_run(cmd: str, check: bool = True):
+        cmds.append(cmd)
+        name = "gunicorn" if "gunicorn" in cmd else "black"
+        dist_info = site_packages / f"{name}-1.0.dist-info"
+        dist_info.mkdir(parents=True)
+        (dist_info / "RECORD").write_text(
+            f"{name}/__init__.py,sha256=abc,1200\n{name}-1.0.dist-info/RECORD,,\n"
+        )
+
+    monkeypatch.setattr(cli_common, "run", fake_run)
+
+    report = cli_common.install_dependencies(tmp_path, "5.2.3")
+
+    assert report == {
+        "runtime": {"added_packages": 1, "added_bytes": 1200},
+        "dev": {"added_packages": 1, "added_bytes": 1200},
+    }
+    assert "gunicorn" in cmds[0] and "black" not in cmds[0]
+    assert "black" in cmds[1]
+
+
+def test_install_dependencies_runtime_only(tmp_path, monkeypatch):
+    cmds = []
+    monkeypatch.setattr(cli_common, "run", lambda cmd, check=True: cmds.append(cmd))
+
+    report = cli_common.install_dependencies(tmp_path, "5.2.3", dev=False)
+
+    assert list(report) == ["runtime"]
+    assert len(cmds) == 1 and "pytest-django" not in cmds[0]
+
+
+@pytest.fixture
+def git_project(tmp_path, monkeypatch):
+    for var in ["GIT_AUTHOR", "GIT_COMMITTER"]:
+        monkeypatch.setenv(f"{var}_NAME", "Test")
+        monkeypatch.setenv(f"{var}_EMAIL", "test@example.com")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "manage.py").write_text("print('hi')\n")
+    for ignored in [".venv/lib/site.py", "staticfiles/app.css", "db.sqlite3"]:
+        (tmp_path / ignored).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / ignored).write_text("x" * 4096)
+    return tmp_path
+
+
+def test_initialize_git_commits_only_project_files(git_project):
+    report = cli_common.initialize_git(git_project)
+
+    committed = subprocess.run(
+        ["git", "ls-files"], capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert committed == [".gitignore", "manage.py"]
+    assert report["files"] == 2
+    assert report["bytes"] == sum((git_project / f).stat().st_size for f in committed)
+
+
+def test_initialize_git_completes_existing_gitignore(git_project):
+    (git_project / ".gitignore").write_text("*.log\n.venv/\n")
+
+    cli_common.initialize_git(git_project)
+
+    lines = (git_project / ".gitignore").read_text().splitlines()
+    assert lines[:2] == ["*.log", ".venv/"]
+    assert lines.count(".venv/") == 1 and "staticfiles/" in lines
+
+
+def test_initialize_git_refuses_commit_over_budget(git_project, monkeypatch):
+    monkeypatch.setenv("INIT_DJANGO_GIT_BUDGET_MB", "0.001")
+
+    with pytest.raises(click.ClickException, match="over the 0.001 MB budget"):
+        cli_common.initialize_git(git_project)
+    # No half-initialized repository is left for the next run to skip
+    assert not (git_project / ".git").exists()
+    assert (git_project / ".gitignore").exists()
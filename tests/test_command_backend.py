@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+
+import pytest
+
+from init_django import command_backend
+
+
+def test_record_then_replay(tmp_path, monkeypatch):
+    transcript = tmp_path / "transcript.json"
+    recorded = tmp_path / "recorded"
+    recorded.mkdir()
+    (recorded / "old.txt").write_text("bye")
+    monkeypatch.chdir(recorded)
+
+    recorder = command_backend.RecordingBackend(transcript)
+    cmd = f"mkdir -p sub && echo {recorded} > sub/where.txt && rm old.txt && pwd"
+    completed = recorder.run(cmd)
+    assert completed.stdout.strip() == str(recorded)
+    with pytest.raises(subprocess.CalledProcessError):
+        recorder.run("exit 3")
+
+    replayed = tmp_path / "replayed"
+    replayed.mkdir()
+    (replayed / "old.txt").write_text("bye")
+    monkeypatch.chdir(replayed)
+
+    player = command_backend.ReplayBackend(transcript)
+    completed = player.run(cmd.replace(str(recorded), str(replayed)))
+    assert completed.stdout.strip() == str(replayed)
+    assert (replayed / "sub" / "where.txt").read_text().strip() == str(replayed)
+    assert not (replayed / "old.txt").exists()
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        player.run("exit 3")
+    assert excinfo.value.returncode == 3
+    player.assert_finished()
+
+
+def test_replay_rejects_unexpected_command(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    transcript = tmp_path / "transcript.json"
+    command_backend.RecordingBackend(transcript).run("true")
+
+    player = command_backend.ReplayBackend(transcript)
+    with pytest.raises(command_backend.TranscriptMismatchError):
+        player.run("false")
+    with pytest.raises(command_backend.TranscriptMismatchError):
+        player.assert_finished()
+
+
+def test_replay_with_another_interpreter(tmp_path, monkeypatch):
+    # Virtualenvs link to the interpreter that created them, which lives
+    # elsewhere on the machine replaying the transcript
+    recording_python = tmp_path / "recording-python"
+    replaying_python = tmp_path / "replaying-python"
+    for prefix in (recording_python, replaying_python):
+        (prefix / "bin").mkdir(parents=True)
+        (prefix / "bin" / "python3").write_text("")
+    transcript = tmp_path / "transcript.json"
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+
+    monkeypatch.setattr(command_backend, "PYTHON_PREFIX", str(recording_python))
+    cmd = f"ln -s {recording_python}/bin/python3 python && echo 'Processing /opt/x.whl'"
+    command_backend.RecordingBackend(transcript).run(cmd)
+    (workdir / "python").unlink()
+    recorded = json.loads(transcript.read_text())["commands"][0]
+    assert recorded["stdout"] == ""  # pip's package locations are dropped
+
+    monkeypatch.setattr(command_backend, "PYTHON_PREFIX", str(replaying_python))
+    player = command_backend.ReplayBackend(transcript)
+    player.run(cmd.replace(str(recording_python), str(replaying_python)))
+    assert os.readlink(workdir / "python") == f"{replaying_python}/bin/python3"
+    assert (workdir / "python").exists()